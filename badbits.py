@@ -12,25 +12,46 @@ import logging
 import sys
 import json
 import time
-import termios
-import tty
 import argparse
+import atexit
+import faulthandler
+import functools
+import importlib.util
 import os
 import platform
+import queue
+import re
+import select
 import shutil
+import signal
+import unicodedata
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple, Union, List, Literal, NamedTuple
+from typing import Dict, Any, Iterator, Optional, TextIO, Tuple, Union, List, Literal, NamedTuple
 
 import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-import moondream as md
 from plyer import notification
 
+try:
+    import orjson  # Optional faster JSON encoder (pip install "badbits[fast]")
+except ImportError:
+    orjson = None
+
+try:
+    import termios
+    import tty
+except ImportError:  # Not available on Windows
+    termios = tty = None
+
 # Alert system imports
 import subprocess
 import webbrowser
-from threading import Thread
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Event, Lock, Thread, current_thread, main_thread
 import tempfile
 import base64
 
@@ -44,6 +65,67 @@ logger = logging.getLogger(__name__)
 # Alert types - extensible for custom habits
 AlertType = str  # Can be any string identifier for a habit
 
+# Moondream releases; every variant ships pre-quantized weights
+MODEL_BASE_URL = "https://huggingface.co/vikhyatk/moondream2/resolve/9dddae84d54db4ac56fe37817aeaeb502ed083e2"
+MODEL_VARIANTS = {
+    "2b-int8": "moondream-2b-int8.mf",      # Most accurate
+    "0_5b-int8": "moondream-0_5b-int8.mf",  # Smaller and faster
+    "0_5b-int4": "moondream-0_5b-int4.mf",  # Smallest, for low-memory machines
+}
+DEFAULT_MODEL_VARIANT = "2b-int8"
+
+# Moondream crops images into at most 2x2 tiles of 378x378 pixels, so it never
+# sees more than 756 pixels along either side of a tile grid
+VISION_MAX_SIDE = 2 * 378
+
+# Native capture backend per platform; the default backend may probe several
+# APIs and negotiate an uncompressed pixel format
+CAMERA_BACKENDS = {
+    "Linux": cv2.CAP_V4L2,
+    "Windows": cv2.CAP_DSHOW,
+    "Darwin": cv2.CAP_AVFOUNDATION,
+}
+
+# Requested capture format. MJPEG frames are only decoded when retrieved, so
+# the frames the grabber skips cost almost nothing; 640x480 already exceeds
+# what the model sees of the current frame in the collage
+CAPTURE_FOURCC = "MJPG"
+CAPTURE_WIDTH = 640
+CAPTURE_HEIGHT = 480
+CAPTURE_FPS = 15
+
+class Colors:
+    """Limited color palette for a clean, cohesive terminal look."""
+    RESET = "\033[0m"
+    BOLD = "\033[1m"
+    DIM = "\033[2m"  # Dimmed text
+    BLUE = "\033[34m"  # Standard blue (not bright)
+    GREEN = "\033[32m"  # Standard green
+    RED = "\033[31m"  # Standard red
+    WHITE = "\033[37m"  # White
+    DIM_RED = "\033[2;31m"  # Dimmed red, for moderate issue rates
+    
+    @classmethod
+    def for_percent(cls, percent: int) -> str:
+        """Color for a session issue percentage: red, dimmed red or green."""
+        if percent > 50:
+            return cls.RED
+        if percent > 25:
+            return cls.DIM_RED
+        return cls.GREEN
+
+# Dashboard history marks, by whether the check had an issue
+TIMELINE_MARKS = {
+    True: f"{Colors.RED}×{Colors.RESET}",
+    False: f"{Colors.GREEN}·{Colors.RESET}",
+}
+
+# Dashboard status labels, by whether the habit's latest check had an issue
+STATUS_INDICATORS = {
+    True: f"{Colors.RED}! NEEDS ATTENTION{Colors.RESET}",
+    False: f"{Colors.GREEN}✓ Good{Colors.RESET}",
+}
+
 class CheckStats:
     """Statistics for a monitoring session with dynamic habit tracking."""
     
@@ -65,19 +147,61 @@ class CheckStats:
         """
         self.total_checks = total_checks
         self.start_time = start_time or datetime.now()
-        self.last_check_time = last_check_time
-        self.habit_alerts = habit_alerts or {}
+        # Durations come from the monotonic clock; start_time is only for display
+        self.start_ns = time.monotonic_ns()
+        if start_time is not None:
+            self.start_ns -= int((datetime.now() - start_time).total_seconds() * 1e9)
+        # Wall-clock nanoseconds, converted to a datetime only when displayed
+        self.last_check_ns: Optional[int] = (
+            int(last_check_time.timestamp() * 1e9) if last_check_time else None
+        )
+        
+        # Alert counts live in one array, indexed by position in habit_types
+        self.habit_types: List[str] = []
+        self._habit_index: Dict[str, int] = {}
+        self._counts = np.zeros(0, dtype=np.int64)
+        for habit, count in (habit_alerts or {}).items():
+            index = self._index_of(habit)
+            self._counts[index] = count
         
         # Initialize alert counts for any new habit types
-        if habit_types:
-            for habit in habit_types:
-                if habit not in self.habit_alerts:
-                    self.habit_alerts[habit] = 0
+        for habit in habit_types or []:
+            self._index_of(habit)
+    
+    def _index_of(self, habit_type: str) -> int:
+        """
+        Get the count slot for a habit, adding one if it's new.
+        
+        Args:
+            habit_type: The habit identifier
+            
+        Returns:
+            Index of the habit in habit_types and the counts array
+        """
+        index = self._habit_index.get(habit_type)
+        if index is None:
+            index = len(self.habit_types)
+            self._habit_index[habit_type] = index
+            self.habit_types.append(habit_type)
+            self._counts = np.append(self._counts, np.int64(0))
+        return index
+    
+    @property
+    def habit_alerts(self) -> Dict[str, int]:
+        """Get a dictionary mapping habit types to alert counts."""
+        return dict(zip(self.habit_types, self._counts.tolist(), strict=True))
     
     @property
     def duration_minutes(self) -> int:
         """Get session duration in minutes."""
-        return (datetime.now() - self.start_time).seconds // 60
+        return (time.monotonic_ns() - self.start_ns) // 60_000_000_000
+    
+    @property
+    def last_check_time(self) -> Optional[datetime]:
+        """Get when the last check was performed."""
+        if self.last_check_ns is None:
+            return None
+        return datetime.fromtimestamp(self.last_check_ns / 1e9)
     
     def get_alert_percent(self, habit_type: str) -> int:
         """
@@ -89,39 +213,60 @@ class CheckStats:
         Returns:
             Percentage of checks that triggered this habit alert
         """
-        if self.total_checks == 0 or habit_type not in self.habit_alerts:
+        index = self._habit_index.get(habit_type)
+        if self.total_checks == 0 or index is None:
             return 0
-        return int((self.habit_alerts[habit_type] / self.total_checks) * 100)
+        return int(self._counts[index] * 100 // self.total_checks)
     
-    def update(self, alerts: List["AlertResult"]) -> "CheckStats":
+    def get_alert_count(self, habit_type: str) -> int:
         """
-        Create updated stats based on new alerts.
+        Get the number of checks with alerts for specific habit.
         
         Args:
-            alerts: List of alert results from current check
+            habit_type: The habit identifier to get the count for
             
         Returns:
-            New CheckStats object with updated counts
+            Number of checks that triggered this habit alert
         """
-        # Create a new habit_alerts dictionary with current values
-        updated_alerts = dict(self.habit_alerts)
+        index = self._habit_index.get(habit_type)
+        return 0 if index is None else int(self._counts[index])
+    
+    def get_alert_percents(self) -> np.ndarray:
+        """
+        Get percentage of checks with alerts for every tracked habit at once.
         
+        Returns:
+            Integer percentages, in the same order as habit_types
+        """
+        if self.total_checks == 0:
+            return np.zeros_like(self._counts)
+        return self._counts * 100 // self.total_checks
+    
+    def record(self, alerts: List["AlertResult"]) -> None:
+        """
+        Update stats in place with the alerts from a new check.
+        
+        Args:
+            alerts: List of alert results from current check
+        """
         # Update alert counts for each habit type that triggered
         for alert in alerts:
             if alert.is_active:
-                if alert.alert_type in updated_alerts:
-                    updated_alerts[alert.alert_type] += 1
-                else:
-                    updated_alerts[alert.alert_type] = 1
-        
-        # Return a new stats object with updated values
-        return CheckStats(
-            habit_types=list(updated_alerts.keys()),
-            total_checks=self.total_checks + 1,
-            start_time=self.start_time,
-            last_check_time=datetime.now(),
-            habit_alerts=updated_alerts
-        )
+                # Look the index up first; a new habit type replaces the array
+                index = self._index_of(alert.alert_type)
+                self._counts[index] += 1
+        
+        self.total_checks += 1
+        self.last_check_ns = time.time_ns()
+
+@functools.lru_cache(maxsize=None)
+def format_alert_type(alert_type: str) -> str:
+    """
+    Turn an alert type identifier into a display title, e.g. "Nail Biting".
+    
+    Alert types come from a small fixed set, so each is only formatted once.
+    """
+    return alert_type.replace("_", " ").title()
 
 class AlertResult:
     """
@@ -130,11 +275,27 @@ class AlertResult:
     This class provides a standardized format for all alerts in the system,
     supporting both serialization to JSON and human-readable display formats.
     """
+    __slots__ = ("alert_type", "is_active", "details", "timestamp_ns", "_timestamp")
+    
+    # (active, ok) emojis for built-in habit types
+    _EMOJI: Dict[str, Tuple[str, str]] = {
+        "posture": ("🪑", "✅"),
+        "nail_biting": ("💅", "✅"),
+        "screen_time": ("🖥️", "✅"),
+        "water": ("💧", "✅"),
+        "stretching": ("🧘", "✅"),
+        "eye_strain": ("👁️", "✅"),
+        "typing_form": ("⌨️", "✅"),
+    }
+    # Generic emojis for custom habits
+    _DEFAULT_EMOJI: Tuple[str, str] = ("⚠️", "✅")
+    
     def __init__(self, 
                  alert_type: AlertType,
                  is_active: bool, 
                  details: str = "",
-                 timestamp: Optional[datetime] = None):
+                 timestamp: Optional[datetime] = None,
+                 timestamp_ns: Optional[int] = None):
         """
         Initialize an alert result.
         
@@ -143,11 +304,25 @@ class AlertResult:
             is_active: Whether the alert is active (True = bad behavior detected)
             details: Additional details about the alert
             timestamp: When the alert was generated
+            timestamp_ns: When the alert was generated, in nanoseconds since the epoch.
+                Used when timestamp isn't given; defaults to now.
         """
         self.alert_type = alert_type
         self.is_active = is_active
         self.details = details
-        self.timestamp = timestamp or datetime.now()
+        # The datetime is built lazily; most alerts are never serialized
+        self._timestamp = timestamp
+        if timestamp is not None:
+            self.timestamp_ns = int(timestamp.timestamp() * 1e9)
+        else:
+            self.timestamp_ns = timestamp_ns if timestamp_ns is not None else time.time_ns()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Get when the alert was generated."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self.timestamp_ns / 1e9)
+        return self._timestamp
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -175,19 +350,9 @@ class AlertResult:
     
     def get_emoji(self) -> str:
         """Get an emoji representation of the alert."""
-        # Default emojis for built-in habit types
-        emoji_map = {
-            "posture": "🪑" if self.is_active else "✅",
-            "nail_biting": "💅" if self.is_active else "✅",
-            "screen_time": "🖥️" if self.is_active else "✅",
-            "water": "💧" if self.is_active else "✅",
-            "stretching": "🧘" if self.is_active else "✅",
-            "eye_strain": "👁️" if self.is_active else "✅",
-            "typing_form": "⌨️" if self.is_active else "✅"
-        }
-        
         # Return the matching emoji or a generic one for custom habits
-        return emoji_map.get(self.alert_type, "⚠️" if self.is_active else "✅")
+        active, ok = self._EMOJI.get(self.alert_type, self._DEFAULT_EMOJI)
+        return active if self.is_active else ok
 
 class HabitCheck:
     """
@@ -196,6 +361,8 @@ class HabitCheck:
     This class encapsulates the definition of a habit to check,
     including its prompt, details, and display properties.
     """
+    __slots__ = ("habit_id", "name", "emoji", "prompt", "details_prompt",
+                 "description", "active_message", "enabled", "_display_name")
     
     def __init__(self, 
                  habit_id: str,
@@ -227,10 +394,14 @@ class HabitCheck:
         self.description = description
         self.active_message = active_message
         self.enabled = default_enabled
+        self._display_name: Optional[str] = None
     
     def get_display_name(self) -> str:
         """Get formatted display name for UI."""
-        return self.name.replace("_", " ").title()
+        # Built once; habit names don't change after loading
+        if self._display_name is None:
+            self._display_name = self.name.replace("_", " ").title()
+        return self._display_name
         
     def get_active_message(self) -> str:
         """Get message to show when habit is detected."""
@@ -266,6 +437,708 @@ class HabitCheck:
         )
 
 
+@contextmanager
+def raw_tty(stream: TextIO) -> Iterator[bool]:
+    """
+    Put a terminal into cbreak mode so single keypresses can be read.
+    
+    Input is delivered a key at a time without echo, while Ctrl+C still
+    raises KeyboardInterrupt. The previous settings are restored on exit.
+    
+    Args:
+        stream: Input stream attached to the terminal
+        
+    Yields:
+        True if the stream is a terminal and was switched, False otherwise
+        (always False where termios isn't available)
+    """
+    if termios is None or not stream.isatty():
+        yield False
+        return
+    
+    fd = stream.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield True
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+@functools.lru_cache(maxsize=None)
+def ansi_supported() -> bool:
+    """
+    Check whether the terminal understands ANSI escape sequences.
+    
+    On Windows this also switches on virtual terminal processing, which
+    consoles on Windows 10 and later support but leave off by default.
+    
+    Returns:
+        True if escape sequences can be written to stdout
+    """
+    if platform.system() != "Windows":
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+def clear_screen() -> None:
+    """Clear the terminal and move the cursor to the top left."""
+    if ansi_supported():
+        # An escape sequence instead of spawning `clear` on every redraw
+        sys.stdout.write("\033[H\033[2J")
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+def show_cursor(visible: bool) -> None:
+    """Show or hide the terminal cursor, where escape sequences work."""
+    if ansi_supported():
+        sys.stdout.write("\033[?25h" if visible else "\033[?25l")
+        sys.stdout.flush()
+
+# SGR and cursor control sequences, which take up no columns on screen
+ANSI_ESCAPE = re.compile(r"\033\[[0-9;?]*[A-Za-z]")
+
+def visible_width(line: str) -> int:
+    """Count the terminal columns a line takes, skipping escape sequences."""
+    return sum(
+        2 if unicodedata.east_asian_width(char) in "WF" else 1
+        for char in ANSI_ESCAPE.sub("", line)
+    )
+
+def redraw_screen(text: str, previous: Optional[List[str]] = None) -> List[str]:
+    """
+    Replace the terminal contents with text without blanking it first.
+    
+    Each line overwrites the one already on screen and clears whatever is
+    left to its right, so a redraw doesn't flicker. Given the lines from
+    the last redraw, only the lines that changed are written, unless the
+    text would scroll or wrap; then line i isn't on screen row i, so
+    everything is rewritten.
+    
+    Args:
+        text: Full screen contents to show
+        previous: Lines returned by the last call, if the screen hasn't
+            been touched since
+            
+    Returns:
+        Lines now on screen, to pass as previous next time
+    """
+    lines = text.split("\n")
+    if not ansi_supported():
+        clear_screen()
+        print(text)
+        return lines
+    
+    columns, rows = shutil.get_terminal_size()
+    if len(lines) >= rows or any(visible_width(line) >= columns for line in lines):
+        previous = None
+    
+    if previous is None:
+        # No trailing newline, so text exactly as tall as the screen doesn't scroll
+        parts = ["\033[H", "\033[K\n".join(lines), "\033[K"]
+    else:
+        # Move to each changed row (1-based) and rewrite just that line
+        parts = [
+            f"\033[{row};1H{line}\033[K"
+            for row, line in enumerate(lines, 1)
+            if row > len(previous) or previous[row - 1] != line
+        ]
+        parts.append(f"\033[{len(lines) + 1};1H")
+    # Clear anything below, such as leftover lines or log output
+    parts.append("\033[J")
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
+    return lines
+
+def read_key(stream: TextIO, timeout: float) -> Optional[str]:
+    """
+    Wait up to timeout seconds for a keypress.
+    
+    Args:
+        stream: Input stream in cbreak mode (see raw_tty)
+        timeout: Longest time to wait, in seconds; 0 just checks
+        
+    Returns:
+        The key pressed, or None if the timeout passed first
+    """
+    ready, _, _ = select.select([stream], [], [], max(0.0, timeout))
+    if not ready:
+        return None
+    # Read the file descriptor directly; a buffered read could pull in more
+    # input than select() would then report as pending
+    return os.read(stream.fileno(), 1).decode(errors="ignore")
+
+def _json_default(obj: Any) -> Any:
+    """Serialize objects the JSON encoders don't handle natively."""
+    if isinstance(obj, (AlertResult, HabitCheck)):
+        return obj.to_dict()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to JSON, using orjson when it is installed.
+    
+    Args:
+        data: Data to serialize; may contain AlertResult, HabitCheck and datetime values
+        indent: Whether to indent the output for people to read and edit
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default,
+                            option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, default=_json_default, indent=2 if indent else None).encode("utf-8")
+
+def open_camera(camera_id: int) -> cv2.VideoCapture:
+    """
+    Open a camera with the platform's native backend.
+    
+    Falls back to OpenCV's default backend when the native one can't open
+    the device.
+    
+    Args:
+        camera_id: Camera device ID
+        
+    Returns:
+        VideoCapture for the device; check isOpened() for success
+    """
+    backend = CAMERA_BACKENDS.get(platform.system())
+    if backend is not None:
+        cap = cv2.VideoCapture(camera_id, backend)
+        if cap.isOpened():
+            return cap
+        cap.release()
+    return cv2.VideoCapture(camera_id)
+
+def configure_camera(cap: cv2.VideoCapture) -> None:
+    """
+    Request a compressed, modest capture format with minimal buffering.
+    
+    Drivers ignore settings they don't support, so this is always safe.
+    
+    Args:
+        cap: Opened VideoCapture to configure
+    """
+    # The pixel format has to be set before the frame size on V4L2
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*CAPTURE_FOURCC))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAPTURE_WIDTH)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAPTURE_HEIGHT)
+    cap.set(cv2.CAP_PROP_FPS, CAPTURE_FPS)
+    # Queue as few frames as possible so reads are fresh
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+def prepare_vision_input(bgr_frame: np.ndarray, max_side: int = VISION_MAX_SIDE) -> Image.Image:
+    """
+    Convert a webcam frame into an RGB PIL image sized for the vision model.
+    
+    Frames larger than the model can resolve are shrunk first, so the color
+    conversion and every later step work on the smaller image.
+    
+    Args:
+        bgr_frame: Frame as returned by OpenCV, in BGR order
+        max_side: Longest side allowed, in pixels
+        
+    Returns:
+        PIL Image no larger than max_side on either side
+    """
+    height, width = bgr_frame.shape[:2]
+    scale = max_side / max(height, width)
+    if scale < 1:
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        bgr_frame = cv2.resize(bgr_frame, size, interpolation=cv2.INTER_AREA)
+    return Image.fromarray(cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB))
+
+def perceptual_hash(image: Union[Image.Image, np.ndarray]) -> int:
+    """
+    Compute a 64-bit DCT perceptual hash of an image.
+    
+    All pixel work happens inside OpenCV's vectorized kernels; nothing
+    loops over pixels in Python.
+    
+    Args:
+        image: RGB image to hash, as a PIL image or array
+        
+    Returns:
+        64-bit hash as an integer; similar images differ in few bits
+    """
+    pixels = np.asarray(image)
+    if pixels.ndim == 3:
+        pixels = cv2.cvtColor(pixels, cv2.COLOR_RGB2GRAY)
+    small = cv2.resize(pixels, (32, 32), interpolation=cv2.INTER_AREA)
+    low_freq = cv2.dct(small.astype(np.float32))[:8, :8]
+    bits = (low_freq > np.median(low_freq)).astype(np.uint8)
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), "big")
+
+
+def hamming_distance(hash_a: int, hash_b: int) -> int:
+    """
+    Count the bits that differ between two perceptual hashes.
+    
+    Args:
+        hash_a: First hash
+        hash_b: Second hash
+        
+    Returns:
+        Number of differing bits
+    """
+    return (hash_a ^ hash_b).bit_count()
+
+# Frame hashes fewer than this many bits apart show the same scene, both for
+# skipping inference and for reusing a cached encoding
+SCENE_MATCH_DISTANCE = 4
+
+
+class VisionCache:
+    """
+    Reuses Moondream image encodings across near-identical frames.
+
+    Webcam scenes change slowly, and often return to an earlier state (the
+    user leans in, then sits back). The most recent encodings are kept in
+    LRU order, keyed by perceptual hash. On a hit the cached encoding is
+    returned and the vision encoder is skipped; only the per-habit queries run.
+    """
+
+    def __init__(self, max_distance: int = SCENE_MATCH_DISTANCE, max_age_seconds: float = 300.0,
+                 max_entries: int = 8):
+        """
+        Initialize the vision cache.
+
+        Args:
+            max_distance: Hamming distance below which hashes count as a hit
+            max_age_seconds: Age after which a cached encoding is re-computed
+            max_entries: Number of encodings to keep before evicting the oldest
+        """
+        self.max_distance = max_distance
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        # image hash -> (encoded image, monotonic time stored), least recent first
+        self._entries: "OrderedDict[int, Tuple[Any, float]]" = OrderedDict()
+
+    def lookup(self, image_hash: int) -> Any:
+        """
+        Get the cached encoding for an image hash.
+
+        Args:
+            image_hash: Perceptual hash of the image about to be encoded
+
+        Returns:
+            Cached encoded image, or None on a miss
+        """
+        now = time.monotonic()
+        best_hash = None
+        best_distance = self.max_distance
+        for cached_hash, (_, timestamp) in list(self._entries.items()):
+            if now - timestamp > self.max_age_seconds:
+                del self._entries[cached_hash]
+                continue
+            distance = hamming_distance(cached_hash, image_hash)
+            if distance < best_distance:
+                best_hash, best_distance = cached_hash, distance
+        
+        if best_hash is None:
+            return None
+        self._entries.move_to_end(best_hash)
+        return self._entries[best_hash][0]
+
+    def store(self, image_hash: int, encoded_image: Any) -> None:
+        """
+        Cache a freshly computed encoding.
+
+        Args:
+            image_hash: Perceptual hash of the encoded image
+            encoded_image: Encoding returned by the vision model
+        """
+        self._entries[image_hash] = (encoded_image, time.monotonic())
+        self._entries.move_to_end(image_hash)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached encodings."""
+        self._entries.clear()
+
+
+class FrameRing:
+    """
+    Recent frame hashes, used to skip inference while the scene is static.
+    
+    When every recent frame looks like the newest one, asking the model
+    again would give the same answers. Inference still runs at least every
+    max_interval_seconds so slow changes are not missed.
+    """
+    
+    def __init__(self, size: int = 8, max_distance: int = SCENE_MATCH_DISTANCE,
+                 max_interval_seconds: float = 300.0):
+        """
+        Initialize the frame ring.
+        
+        Args:
+            size: Number of recent frame hashes to keep
+            max_distance: Hamming distance below which frames count as unchanged
+            max_interval_seconds: Longest time to go without running inference
+        """
+        self.max_distance = max_distance
+        self.max_interval_seconds = max_interval_seconds
+        self.hashes: deque = deque(maxlen=size)
+        self.last_inference = 0.0
+    
+    def push(self, image_hash: int) -> None:
+        """
+        Add the hash of the newest frame.
+        
+        Args:
+            image_hash: Perceptual hash of the frame
+        """
+        self.hashes.append(image_hash)
+    
+    def is_static(self) -> bool:
+        """Check whether all recent frames match the newest one."""
+        if len(self.hashes) < 2:
+            return False
+        newest = self.hashes[-1]
+        return all(
+            hamming_distance(newest, image_hash) < self.max_distance
+            for image_hash in list(self.hashes)[:-1]
+        )
+    
+    def should_infer(self) -> bool:
+        """Check whether the newest frame needs a fresh model run."""
+        if time.monotonic() - self.last_inference >= self.max_interval_seconds:
+            return True
+        return not self.is_static()
+    
+    def mark_inference(self) -> None:
+        """Record that inference just ran."""
+        self.last_inference = time.monotonic()
+    
+    def clear(self) -> None:
+        """Forget all frames, forcing inference on the next one."""
+        self.hashes.clear()
+        self.last_inference = 0.0
+
+
+class PromptTokenCache:
+    """
+    Tokenizer wrapper that remembers the encodings of known prompts.
+    
+    Moondream tokenizes the question string on every query, but habit
+    prompts never change, so their token IDs are computed once up front.
+    Any other text is passed straight through to the wrapped tokenizer.
+    """
+    
+    def __init__(self, tokenizer: Any, prompts: List[str]):
+        """
+        Initialize the cache and tokenize the given prompts.
+        
+        Args:
+            tokenizer: Tokenizer used by the vision model
+            prompts: Prompts to tokenize ahead of time
+        """
+        self._tokenizer = tokenizer
+        self._encodings: Dict[str, Any] = {}
+        self.add(prompts)
+    
+    def add(self, prompts: List[str]) -> None:
+        """
+        Tokenize prompts ahead of time.
+        
+        Args:
+            prompts: Prompts to add to the cache
+        """
+        for prompt in prompts:
+            if prompt not in self._encodings:
+                self._encodings[prompt] = self._tokenizer.encode(prompt)
+    
+    def encode(self, text: str, *args: Any, **kwargs: Any) -> Any:
+        """Return the cached encoding for a known prompt, or encode it."""
+        if not args and not kwargs:
+            encoding = self._encodings.get(text)
+            if encoding is not None:
+                return encoding
+        return self._tokenizer.encode(text, *args, **kwargs)
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tokenizer, name)
+
+
+class FrameGrabber(Thread):
+    """
+    Continuously grabs webcam frames on a background thread.
+    
+    Frames are grabbed as fast as the camera delivers them so the driver's
+    buffer never fills with stale frames, but only decoded when one is
+    requested. Checks run far less often than the camera's frame rate, so
+    almost every frame is skipped without paying for its decode.
+    """
+    
+    def __init__(self, cap: cv2.VideoCapture):
+        """
+        Initialize the frame grabber.
+        
+        Args:
+            cap: Opened video capture to read frames from
+        """
+        super().__init__(name="bb-grabber", daemon=True)
+        self.cap = cap
+        self._frame: Optional[np.ndarray] = None
+        self._wanted = Event()
+        self._ready = Event()
+        self._stopped = Event()
+    
+    def run(self) -> None:
+        """Grab frames until stopped, decoding one whenever it's requested."""
+        while not self._stopped.is_set():
+            if not self.cap.grab():
+                # Avoid spinning while the camera has nothing to give
+                time.sleep(0.005)
+                continue
+            
+            if self._wanted.is_set():
+                # Decode into the previous frame's buffer; OpenCV only
+                # allocates a new one if the frame size changed
+                ret, frame = self.cap.retrieve(self._frame)
+                if ret:
+                    self._frame = frame
+                    self._wanted.clear()
+                    self._ready.set()
+    
+    def read(self, timeout: float) -> Optional[np.ndarray]:
+        """
+        Get the next frame the camera delivers.
+        
+        The frame's buffer is reused for the next one, so callers must be
+        done with it (or copy it) before reading again.
+        
+        Args:
+            timeout: Seconds to wait for a frame
+            
+        Returns:
+            BGR frame, or None if no frame arrived in time
+        """
+        self._ready.clear()
+        self._wanted.set()
+        if not self._ready.wait(timeout):
+            self._wanted.clear()
+            return None
+        return self._frame
+    
+    def stop(self) -> None:
+        """Stop reading frames and wait for the thread to exit."""
+        self._stopped.set()
+        if self.is_alive():
+            self.join(timeout=2)
+
+
+class AnalysisWorker(Thread):
+    """
+    Captures and analyzes frames on a background thread.
+    
+    Checks are requested by the monitoring loop and answered through a
+    results queue, so the main thread stays free to react to keys while
+    the model runs. Frame grabbing already runs on its own thread, so
+    camera, model and UI work all overlap.
+    """
+    
+    def __init__(self, monitor: "HabitMonitor"):
+        """
+        Initialize the analysis worker.
+        
+        Args:
+            monitor: Monitor whose camera and model to use
+        """
+        super().__init__(name="bb-analysis", daemon=True)
+        self.monitor = monitor
+        self.requests: queue.Queue = queue.Queue(maxsize=1)
+        self.results: queue.Queue = queue.Queue()
+    
+    def run(self) -> None:
+        """Run one check per request until stopped."""
+        while True:
+            if self.requests.get() is None:
+                return
+            try:
+                result: Any = self.monitor.check_frame(self.monitor.capture_frame())
+            except Exception as e:
+                # Handed to the monitoring loop, which decides what's fatal
+                result = e
+            self.results.put(result)
+    
+    def request_check(self) -> None:
+        """Ask for a check of the current frame."""
+        self.requests.put(True)
+    
+    def stop(self) -> None:
+        """Stop after the current check and wait briefly for the thread to exit."""
+        try:
+            self.requests.put_nowait(None)
+        except queue.Full:
+            pass  # A check is still queued; the daemon thread dies with the process
+        if self.is_alive():
+            self.join(timeout=2)
+
+
+# Short notification ping played by the browser alert pages (8 kHz mono WAV)
+PING_SOUND_B64 = (
+    "UklGRnoGAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAZGF0YQoGAACBhYqFbF1fdJivrJBhNjVgodDbq2Ec"
+    "Bj+a2/LDciUFLIHO8tiJNwgZaLvt559NEAxQp+PurWcHENCa0evBhDEQKXrF5cqQRBMeSKjd+b97HwMvh9f0yH4+"
+    "ChuBx+PMjkwXHFSs2se1RQxDn+DtwH0rnNJ8IQIwktvoq1kJBGjN9dO5Y0wZVbBS+tzZgAlQwHIaA36i1tuYNhBZ"
+    "tm4TEnnS775sRzFWqVoPaLj34IQM6p9cHTC07vKVGUCo3t+DSBxLr/THdxpDzpdTFWmo2/OgMg05074jETib6ueE"
+    "J+aWTxFrw/vieQgTgOMOMn3Y/K9RBliX7tgYAoTsLj2M1ueZKQNwu1ISWaf0xVwC0qlNFG3I/MhRA2Go99QPCvXq"
+    "gRbVpMTSkigJSbCKbwAPecXw12YM3p9QFXfT/89PAl2m9r8cCPnlfQvosnnXiUAQZbODTgEUfc7yxlMF76RdHHHB"
+    "+spLBYrg4Yk6AcyYSxmA1P3NTAFUvM4yV4Tj7GANDJrQ2pUzDF2iyQEzjPL5jzUFZrXnBFJ9++etKc70jSMsj++8"
+    "LBgTpOL9ClB9/vemJd73myxMmOXOGhEis/v9LE0omsQ5S5fiyicEP7D//FFhHJG2Ognvw/c2VRScr6FpB3e1+fwu"
+    "CNu4fXkPxqFsPA6MytajLQlZvILvD9rdsQ8PwbnB/kZAYqOsZw9/o8joYA0WqbbGBQV9zdudDom7ywsLyLvLBgpx"
+    "wsIJCPzN9zdRCvnHzQAJ/9L3M1YK88XP"
+)
+
+class _NotificationRequestHandler(BaseHTTPRequestHandler):
+    """Serves the notifications page and its event stream."""
+    
+    server: "NotificationServer"
+    
+    def do_GET(self) -> None:
+        if self.path == "/":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(self.server.page)))
+            self.end_headers()
+            self.wfile.write(self.server.page)
+        elif self.path == "/events":
+            self._stream_events()
+        else:
+            self.send_error(404)
+    
+    def _stream_events(self) -> None:
+        """Push notifications to the page as Server-Sent Events."""
+        try:
+            last_id = int(self.headers.get("Last-Event-ID", 0))
+        except ValueError:
+            last_id = 0
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        
+        events = self.server.subscribe(last_id)
+        try:
+            while not self.server.stopped.is_set():
+                try:
+                    event = events.get(timeout=15)
+                except queue.Empty:
+                    # Comment line; lets us notice closed tabs
+                    event = b": keep-alive\n\n"
+                self.wfile.write(event)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.server.unsubscribe(events)
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("Notification server: " + format, *args)
+
+class NotificationServer(ThreadingHTTPServer):
+    """
+    Local HTTP server that pushes notifications to an open browser tab.
+    
+    The page is served at / and listens on /events, so new notifications
+    show up live instead of after a refresh. Recent notifications are kept
+    and replayed to tabs that connect (or reconnect) later.
+    """
+    
+    daemon_threads = True
+    
+    def __init__(self, page: str, history: int = 100):
+        """
+        Bind the server to a free port on localhost.
+        
+        Args:
+            page: HTML for the notifications page
+            history: Number of recent notifications replayed to new tabs
+        """
+        super().__init__(("127.0.0.1", 0), _NotificationRequestHandler)
+        self.page = page.encode("utf-8")
+        self.stopped = Event()
+        self._lock = Lock()
+        self._next_id = 1
+        self._history: deque = deque(maxlen=history)
+        self._clients: List[queue.Queue] = []
+        self._thread: Optional[Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """Get the address of the notifications page."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+    
+    def start(self) -> None:
+        """Start serving on a background thread."""
+        self._thread = Thread(target=self.serve_forever, name="bb-notify", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.stopped.set()
+        if self._thread is not None:
+            self.shutdown()
+            self._thread = None
+        self.server_close()
+    
+    def publish(self, payload: Dict[str, Any]) -> None:
+        """
+        Send a notification to every connected tab.
+        
+        Args:
+            payload: JSON-serializable notification data
+        """
+        with self._lock:
+            event_id = self._next_id
+            self._next_id += 1
+            event = f"id: {event_id}\ndata: {json.dumps(payload)}\n\n".encode("utf-8")
+            self._history.append((event_id, event))
+            for client in self._clients:
+                try:
+                    client.put_nowait(event)
+                except queue.Full:
+                    pass  # Tab isn't reading; it catches up from history on reconnect
+    
+    def subscribe(self, last_id: int = 0) -> queue.Queue:
+        """
+        Register a tab, queueing any notifications it hasn't seen yet.
+        
+        Args:
+            last_id: ID of the last notification the tab received
+            
+        Returns:
+            Queue of encoded events for this tab
+        """
+        client: queue.Queue = queue.Queue(maxsize=self._history.maxlen)
+        with self._lock:
+            for event_id, event in self._history:
+                if event_id > last_id:
+                    client.put_nowait(event)
+            self._clients.append(client)
+        return client
+    
+    def unsubscribe(self, client: queue.Queue) -> None:
+        """Forget a tab that has disconnected."""
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+
 class AlertManager:
     """
     Manages different types of alert notifications for BadBits.
@@ -278,6 +1151,8 @@ class AlertManager:
     - Dramatic full-screen interruption alerts
     """
     
+    PING_SOUND_URI = f"data:audio/wav;base64,{PING_SOUND_B64}"
+    
     def __init__(self, app_name: str = "BadBits"):
         """
         Initialize the alert manager.
@@ -287,10 +1162,102 @@ class AlertManager:
         """
         self.app_name = app_name
         self.system = platform.system()
-        self.notification_html = None
+        self.notification_server: Optional[NotificationServer] = None
         self.browser_window = None
+        self._server_lock = Lock()
         
-    def desktop_notification(self, title: str, message: str, timeout: int = 10) -> bool:
+        # Probe notification tools once; PATH doesn't change while we run
+        self._tools: Dict[str, Optional[str]] = {
+            name: shutil.which(name)
+            for name in ("osascript", "terminal-notifier", "notify-send", "zenity",
+                         "powershell", "msg", "afplay", "paplay")
+        }
+        
+        # plyer needs pyobjus for macOS notifications; look for it once here
+        self._has_pyobjus = False
+        if self.system == "Darwin":
+            try:
+                self._has_pyobjus = importlib.util.find_spec("pyobjus") is not None
+            except Exception:
+                pass
+            if not self._has_pyobjus:
+                logger.warning("The pyobjus package is required for macOS notifications")
+                logger.warning("To install: pip install pyobjus")
+        
+        # Deliver alerts off the monitoring thread; subprocess and IPC calls
+        # can take hundreds of milliseconds
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bb-alert")
+        
+        # atexit runs handlers in reverse, so pending alerts drain before the
+        # notification server goes away
+        atexit.register(self._stop_notification_server)
+        atexit.register(self._pool.shutdown)
+    
+    def desktop_notification(self, title: str, message: str, timeout: int = 10) -> "Future[bool]":
+        """
+        Send a desktop notification in the background.
+        
+        Args:
+            title: Notification title
+            message: Notification message
+            timeout: Notification timeout in seconds
+            
+        Returns:
+            Future resolving to True if successful, False otherwise
+        """
+        return self._pool.submit(self._sync_desktop_notification, title, message, timeout)
+    
+    def system_alert(self, title: str, message: str) -> "Future[bool]":
+        """
+        Show a system alert in the background.
+        
+        Args:
+            title: Alert title
+            message: Alert message
+            
+        Returns:
+            Future resolving to True if successful, False otherwise
+        """
+        return self._pool.submit(self._sync_system_alert, title, message)
+    
+    def sound_alert(self) -> "Future[bool]":
+        """
+        Play a sound alert in the background.
+        
+        Returns:
+            Future resolving to True if successful, False otherwise
+        """
+        return self._pool.submit(self._sync_sound_alert)
+    
+    def browser_notification(self, title: str, message: str,
+                             is_alert: bool = True) -> "Future[bool]":
+        """
+        Show a browser notification in the background.
+        
+        Args:
+            title: Notification title
+            message: Notification message
+            is_alert: Whether to mark as critical alert with red styling
+            
+        Returns:
+            Future resolving to True if successful, False otherwise
+        """
+        return self._pool.submit(self._sync_browser_notification, title, message, is_alert)
+    
+    def dramatic_alert(self, title: str, message: str) -> "Future[bool]":
+        """
+        Display a dramatic full-screen alert in the background.
+        
+        Args:
+            title: Alert title
+            message: Alert message
+            
+        Returns:
+            Future resolving to True if successful, False otherwise
+        """
+        return self._pool.submit(self._sync_dramatic_alert, title, message)
+        
+    def _sync_desktop_notification(self, title: str, message: str, timeout: int = 10) -> bool:
         """
         Send a desktop notification using plyer.
         
@@ -304,18 +1271,9 @@ class AlertManager:
         """
         try:
             # Try to handle the common pyobjus missing error on macOS specifically
-            if self.system == "Darwin":
-                # Check if pyobjus is available before using notification
-                try:
-                    import importlib
-                    if importlib.util.find_spec("pyobjus") is None:
-                        logger.warning("The pyobjus package is required for macOS notifications")
-                        logger.warning("To install: pip install pyobjus")
-                        # Use AppleScript directly as fallback
-                        return self.system_alert(title, message)
-                except Exception:
-                    # Fallback to system notification
-                    return self.system_alert(title, message)
+            if self.system == "Darwin" and not self._has_pyobjus:
+                # Use AppleScript directly as fallback
+                return self._sync_system_alert(title, message)
             
             # Try the regular notification mechanism
             notification.notify(
@@ -330,7 +1288,7 @@ class AlertManager:
             # Return False to allow fallback methods
             return False
             
-    def system_alert(self, title: str, message: str) -> bool:
+    def _sync_system_alert(self, title: str, message: str) -> bool:
         """
         Show system alert using platform-specific methods.
         
@@ -341,89 +1299,91 @@ class AlertManager:
         Returns:
             True if successful, False otherwise
         """
+        tools = self._tools
         try:
             if self.system == "Darwin":  # macOS
                 # First try applescript for macOS
-                try:
-                    apple_script = f'display notification "{message}" with title "{title}"'
-                    subprocess.run(["osascript", "-e", apple_script], check=True)
-                    return True
-                except Exception as e:
-                    logger.warning(f"AppleScript notification failed: {e}")
+                if tools["osascript"]:
+                    try:
+                        apple_script = f'display notification "{message}" with title "{title}"'
+                        subprocess.run([tools["osascript"], "-e", apple_script], check=True)
+                        return True
+                    except Exception as e:
+                        logger.warning(f"AppleScript notification failed: {e}")
                     
                 # If AppleScript fails, try terminal-notifier as fallback
-                try:
-                    # Check if terminal-notifier is installed
-                    which_result = subprocess.run(
-                        ["which", "terminal-notifier"], 
-                        stdout=subprocess.PIPE, 
-                        stderr=subprocess.PIPE
-                    )
-                    
-                    if which_result.returncode == 0:
+                if tools["terminal-notifier"]:
+                    try:
                         subprocess.run([
-                            "terminal-notifier",
+                            tools["terminal-notifier"],
                             "-title", title,
                             "-message", message,
                             "-sound", "default"
                         ], check=True)
                         return True
-                    else:
-                        logger.warning("terminal-notifier not found. To install: brew install terminal-notifier")
-                except Exception as e:
-                    logger.warning(f"terminal-notifier failed: {e}")
+                    except Exception as e:
+                        logger.warning(f"terminal-notifier failed: {e}")
+                else:
+                    logger.warning("terminal-notifier not found. "
+                                   "To install: brew install terminal-notifier")
                     
             elif self.system == "Linux":
                 # Try multiple Linux notification methods
                 
                 # First try notify-send
-                try:
-                    subprocess.run([
-                        "notify-send", 
-                        title, 
-                        message,
-                        "--icon=dialog-information"
-                    ], check=True)
-                    return True
-                except Exception as e:
-                    logger.warning(f"notify-send failed: {e}")
+                if tools["notify-send"]:
+                    try:
+                        subprocess.run([
+                            tools["notify-send"], 
+                            title, 
+                            message,
+                            "--icon=dialog-information"
+                        ], check=True)
+                        return True
+                    except Exception as e:
+                        logger.warning(f"notify-send failed: {e}")
                 
                 # Then try zenity
-                try:
-                    subprocess.run([
-                        "zenity", 
-                        "--info", 
-                        f"--title={title}", 
-                        f"--text={message}"
-                    ], check=True)
-                    return True
-                except Exception as e:
-                    logger.warning(f"zenity notification failed: {e}")
+                if tools["zenity"]:
+                    try:
+                        subprocess.run([
+                            tools["zenity"], 
+                            "--info", 
+                            f"--title={title}", 
+                            f"--text={message}"
+                        ], check=True)
+                        return True
+                    except Exception as e:
+                        logger.warning(f"zenity notification failed: {e}")
                     
             elif self.system == "Windows":
                 # Try multiple Windows notification methods
                 
                 # First try PowerShell notification
-                try:
-                    powershell_cmd = f'[System.Windows.Forms.MessageBox]::Show("{message}", "{title}")'
-                    subprocess.run(
-                        ["powershell", "-Command", powershell_cmd],
-                        check=True
-                    )
-                    return True
-                except Exception as e:
-                    logger.warning(f"PowerShell notification failed: {e}")
+                if tools["powershell"]:
+                    try:
+                        powershell_cmd = (
+                            f'[System.Windows.Forms.MessageBox]::Show("{message}", "{title}")'
+                        )
+                        subprocess.run(
+                            [tools["powershell"], "-Command", powershell_cmd],
+                            check=True
+                        )
+                        return True
+                    except Exception as e:
+                        logger.warning(f"PowerShell notification failed: {e}")
                 
                 # Then try msg command for Windows
-                try:
-                    subprocess.run([
-                        "msg", 
-                        "%username%", 
-                        f"{title}: {message}"
-                    ], check=True)
-                    return True
-                except Exception as e:
-                    logger.warning(f"Windows msg command failed: {e}")
+                if tools["msg"]:
+                    try:
+                        subprocess.run([
+                            tools["msg"], 
+                            "%username%", 
+                            f"{title}: {message}"
+                        ], check=True)
+                        return True
+                    except Exception as e:
+                        logger.warning(f"Windows msg command failed: {e}")
             
             # If we get here, all platform-specific methods failed
             return False
@@ -431,7 +1391,7 @@ class AlertManager:
             logger.warning(f"System alert failed: {e}")
             return False
     
-    def sound_alert(self) -> bool:
+    def _sync_sound_alert(self) -> bool:
         """
         Play a sound alert.
         
@@ -439,11 +1399,13 @@ class AlertManager:
             True if successful, False otherwise
         """
         try:
-            if self.system == "Darwin":  # macOS
-                subprocess.run(["afplay", "/System/Library/Sounds/Ping.aiff"], check=True)
+            if self.system == "Darwin" and self._tools["afplay"]:  # macOS
+                subprocess.run([self._tools["afplay"], "/System/Library/Sounds/Ping.aiff"],
+                               check=True)
                 return True
-            elif self.system == "Linux":
-                subprocess.run(["paplay", "/usr/share/sounds/freedesktop/stereo/complete.oga"], check=True)
+            elif self.system == "Linux" and self._tools["paplay"]:
+                subprocess.run([self._tools["paplay"],
+                                "/usr/share/sounds/freedesktop/stereo/complete.oga"], check=True)
                 return True
             elif self.system == "Windows":
                 import winsound
@@ -519,7 +1481,7 @@ class AlertManager:
             document.getElementById('notifications').prepend(container);
             
             // Play sound
-            new Audio('data:audio/wav;base64,UklGRnoGAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAZGF0YQoGAACBhYqFbF1fdJivrJBhNjVgodDbq2EcBj+a2/LDciUFLIHO8tiJNwgZaLvt559NEAxQp+PurWcHENCa0evBhDEQKXrF5cqQRBMeSKjd+b97HwMvh9f0yH4+ChuBx+PMjkwXHFSs2se1RQxDn+DtwH0rnNJ8IQIwktvoq1kJBGjN9dO5Y0wZVbBS+tzZgAlQwHIaA36i1tuYNhBZtm4TEnnS775sRzFWqVoPaLj34IQM6p9cHTC07vKVGUCo3t+DSBxLr/THdxpDzpdTFWmo2/OgMg05074jETib6ueEJ+aWTxFrw/vieQgTgOMOMn3Y/K9RBliX7tgYAoTsLj2M1ueZKQNwu1ISWaf0xVwC0qlNFG3I/MhRA2Go99QPCvXqgRbVpMTSkigJSbCKbwAPecXw12YM3p9QFXfT/89PAl2m9r8cCPnlfQvosnnXiUAQZbODTgEUfc7yxlMF76RdHHHB+spLBYrg4Yk6AcyYSxmA1P3NTAFUvM4yV4Tj7GANDJrQ2pUzDF2iyQEzjPL5jzUFZrXnBFJ9++etKc70jSMsj++8LBgTpOL9ClB9/vemJd73myxMmOXOGhEis/v9LE0omsQ5S5fiyicEP7D//FFhHJG2Ognvw/c2VRScr6FpB3e1+fwuCNu4fXkPxqFsPA6MytajLQlZvILvD9rdsQ8PwbnB/kZAYqOsZw9/o8joYA0WqbbGBQV9zdudDom7ywsLyLvLBgpxwsIJCPzN9zdRCvnHzQAJ/9L3M1YK88XP', false).play();
+            new Audio('{self.PING_SOUND_URI}').play();
             
             // Optionally show notification via Notification API if supported
             if (Notification.permission === "granted") {{
@@ -540,6 +1502,15 @@ class AlertManager:
             }}
         }});
         
+        // Receive live notifications from the local server
+        const events = new EventSource('/events');
+        events.onmessage = function(event) {{
+            const data = JSON.parse(event.data);
+            if (data.type === 'notification') {{
+                addNotification(data.title, data.message, data.isAlert);
+            }}
+        }};
+        
         // Log ready status
         console.log("BadBits notification system ready");
     </script>
@@ -547,7 +1518,27 @@ class AlertManager:
 </html>"""
         return html
     
-    def browser_notification(self, title: str, message: str, is_alert: bool = True) -> bool:
+    @staticmethod
+    def _js_string(value: str) -> str:
+        """
+        Encode a value as a JavaScript string literal safe to embed in HTML.
+        
+        Args:
+            value: Text to encode
+            
+        Returns:
+            Quoted string literal, with "</" escaped so it can't end a script block
+        """
+        return json.dumps(value).replace("</", "<\\/")
+    
+    def _stop_notification_server(self) -> None:
+        """Shut down the browser notification server if it was started."""
+        with self._server_lock:
+            if self.notification_server is not None:
+                self.notification_server.stop()
+                self.notification_server = None
+    
+    def _sync_browser_notification(self, title: str, message: str, is_alert: bool = True) -> bool:
         """
         Show notification in browser window.
         
@@ -560,50 +1551,34 @@ class AlertManager:
             True if successful, False otherwise
         """
         try:
-            # Create HTML file if not already created
-            if self.notification_html is None:
-                # Create temporary HTML file
-                fd, path = tempfile.mkstemp(suffix='.html', prefix='badbits_notifications_')
-                self.notification_html = path
-                with open(path, 'w') as f:
-                    f.write(self._create_notification_html())
+            with self._server_lock:
+                # Start the local notification server if not already running
+                if self.notification_server is None:
+                    server = NotificationServer(self._create_notification_html())
+                    server.start()
+                    self.notification_server = server
                 
-                # Open browser window if not already open
-                if self.browser_window is None:
-                    # Open in new browser window
-                    webbrowser.open('file://' + path, new=1)
+                    # Open browser window if not already open
+                    if self.browser_window is None:
+                        # Open in new browser window
+                        webbrowser.open(server.url, new=1)
+                        self.browser_window = True  # Mark as opened
                 
-            # Open file:// URL if we haven't opened it yet
-            if self.browser_window is None:
-                self.browser_window = True  # Mark as opened
-            
-            # Execute JavaScript to add notification
-            # This won't work directly due to browser security, but we'll update the HTML
-            # The notification will be shown when user refreshes page
-            with open(self.notification_html, 'r') as f:
-                content = f.read()
-            
-            # Add notification entry by modifying the HTML
-            notification_entry = f"""
-            <script>
-                // Add notification on page load
-                window.addEventListener('load', function() {{
-                    addNotification("{title}", "{message}", {str(is_alert).lower()});
-                }});
-            </script>
-            """
-            modified_content = content.replace('</body>', notification_entry + '</body>')
-            
-            with open(self.notification_html, 'w') as f:
-                f.write(modified_content)
+                # The open tab receives this immediately over its event stream
+                self.notification_server.publish({
+                    "type": "notification",
+                    "title": title,
+                    "message": message,
+                    "isAlert": is_alert,
+                })
                 
-            return True
+                return True
                 
         except Exception as e:
             logger.warning(f"Browser notification failed: {e}")
             return False
     
-    def dramatic_alert(self, title: str, message: str) -> bool:
+    def _sync_dramatic_alert(self, title: str, message: str) -> bool:
         """
         Display a dramatic full-screen alert that interrupts user workflow.
         
@@ -625,7 +1600,7 @@ class AlertManager:
             html = f"""<!DOCTYPE html>
 <html>
 <head>
-    <title>{title}</title>
+    <title></title>
     <style>
         body {{
             margin: 0;
@@ -705,13 +1680,18 @@ class AlertManager:
 <body>
     <div class="container">
         <div class="emoji">⚠️</div>
-        <h1>{title}</h1>
-        <div class="message">{message}</div>
+        <h1 id="alertTitle"></h1>
+        <div class="message" id="alertMessage"></div>
         <button class="dismiss" id="dismissBtn">I'll Fix This Now</button>
         <div class="countdown" id="countdown">Alert will close in 15 seconds</div>
     </div>
     
     <script>
+        // Set text through the DOM so quotes and markup in it are shown as-is
+        document.title = {self._js_string(title)};
+        document.getElementById('alertTitle').textContent = {self._js_string(title)};
+        document.getElementById('alertMessage').textContent = {self._js_string(message)};
+        
         // Auto-dismiss after 15 seconds
         let secondsLeft = 15;
         const countdownEl = document.getElementById('countdown');
@@ -737,7 +1717,7 @@ class AlertManager:
         
         // Make the alert more attention-grabbing
         const playSound = () => {{
-            const audio = new Audio('data:audio/wav;base64,UklGRnoGAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAZGF0YQoGAACBhYqFbF1fdJivrJBhNjVgodDbq2EcBj+a2/LDciUFLIHO8tiJNwgZaLvt559NEAxQp+PurWcHENCa0evBhDEQKXrF5cqQRBMeSKjd+b97HwMvh9f0yH4+ChuBx+PMjkwXHFSs2se1RQxDn+DtwH0rnNJ8IQIwktvoq1kJBGjN9dO5Y0wZVbBS+tzZgAlQwHIaA36i1tuYNhBZtm4TEnnS775sRzFWqVoPaLj34IQM6p9cHTC07vKVGUCo3t+DSBxLr/THdxpDzpdTFWmo2/OgMg05074jETib6ueEJ+aWTxFrw/vieQgTgOMOMn3Y/K9RBliX7tgYAoTsLj2M1ueZKQNwu1ISWaf0xVwC0qlNFG3I/MhRA2Go99QPCvXqgRbVpMTSkigJSbCKbwAPecXw12YM3p9QFXfT/89PAl2m9r8cCPnlfQvosnnXiUAQZbODTgEUfc7yxlMF76RdHHHB+spLBYrg4Yk6AcyYSxmA1P3NTAFUvM4yV4Tj7GANDJrQ2pUzDF2iyQEzjPL5jzUFZrXnBFJ9++etKc70jSMsj++8LBgTpOL9ClB9/vemJd73myxMmOXOGhEis/v9LE0omsQ5S5fiyicEP7D//FFhHJG2Ognvw/c2VRScr6FpB3e1+fwuCNu4fXkPxqFsPA6MytajLQlZvILvD9rdsQ8PwbnB/kZAYqOsZw9/o8joYA0WqbbGBQV9zdudDom7ywsLyLvLBgpxwsIJCPzN9zdRCvnHzQAJ/9L3M1YK88XP');
+            const audio = new Audio('{self.PING_SOUND_URI}');
             audio.play();
         }};
         
@@ -767,7 +1747,7 @@ class AlertManager:
             webbrowser.open('file://' + path, new=1)
             
             # Play system alert sound for additional attention
-            self.sound_alert()
+            self._sync_sound_alert()
             
             return True
             
@@ -775,10 +1755,13 @@ class AlertManager:
             logger.warning(f"Dramatic alert failed: {e}")
             return False
 
-    def send_alert(self, title: str, message: str, methods: List[str] = None) -> None:
+    def send_alert(self, title: str, message: str, methods: List[str] = None) -> "Future[None]":
         """
         Send alert using multiple methods with fallbacks.
         
+        The fallback chain runs on the alert thread pool, so this returns
+        immediately without waiting for any notification to be shown.
+        
         Args:
             title: Alert title
             message: Alert message
@@ -788,6 +1771,20 @@ class AlertManager:
                     - 'browser': Browser notification
                     - 'dramatic': Full-screen dramatic alert
                     - 'sound': Sound alert
+                    
+        Returns:
+            Future that completes once the alert has been delivered
+        """
+        return self._pool.submit(self._sync_send_alert, title, message, methods)
+    
+    def _sync_send_alert(self, title: str, message: str, methods: List[str] = None) -> None:
+        """
+        Send alert using multiple methods with fallbacks, blocking until done.
+        
+        Args:
+            title: Alert title
+            message: Alert message
+            methods: List of methods to try in order of preference
         """
         if methods is None:
             methods = ['desktop', 'system', 'browser', 'sound']
@@ -797,27 +1794,27 @@ class AlertManager:
         # First try preferred methods in order
         for method in methods:
             if method == 'desktop':
-                success = self.desktop_notification(title, message)
+                success = self._sync_desktop_notification(title, message)
                 if success:
                     break
             elif method == 'system':
-                success = self.system_alert(title, message)
+                success = self._sync_system_alert(title, message)
                 if success:
                     break
             elif method == 'browser':
-                success = self.browser_notification(title, message)
+                success = self._sync_browser_notification(title, message)
                 if success:
                     break
             elif method == 'dramatic':
-                success = self.dramatic_alert(title, message)
+                success = self._sync_dramatic_alert(title, message)
                 if success:
                     break
             elif method == 'sound':
-                success = self.sound_alert()
+                success = self._sync_sound_alert()
         
         # Always play sound unless we explicitly succeeded with sound method
         if 'sound' not in methods or not success:
-            self.sound_alert()
+            self._sync_sound_alert()
 
 class HabitMonitor:
     """
@@ -827,6 +1824,17 @@ class HabitMonitor:
     and habit detection using the Moondream vision language model.
     """
     
+    # Collage layout: white strip between the two images and black frame width
+    COLLAGE_GAP = 50
+    COLLAGE_BORDER = 2
+    
+    # Decoding budget for yes/no answers; a few tokens leave room for
+    # "Yes." or a leading space without letting the model ramble
+    ANSWER_MAX_TOKENS = 4
+    
+    # Archived collages are for reviewing progress, not pixel-level detail
+    ARCHIVE_JPEG_QUALITY = 60
+    
     def __init__(self, model_path: Union[str, Path], camera_id: int = 0, 
                  backup_camera_ids: List[int] = None, output_dir: str = "habit_monitor",
                  custom_habits_file: Optional[str] = None):
@@ -853,19 +1861,53 @@ class HabitMonitor:
             self.output_dir = Path(output_dir)
             self.output_dir.mkdir(exist_ok=True)
             
+            # Archive writes run off the monitoring loop; a single worker keeps
+            # them in order. Pending writes still finish when the program exits
+            self._archive_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bb-archive")
+            
             # Store reference image
             self.reference_image: Optional[Image.Image] = None
+            self._reference_top: Optional[np.ndarray] = None
+            self._collage_buffer: Optional[np.ndarray] = None
+            self._label_font = ImageFont.load_default()
             
             # Store camera IDs
             self.camera_id = camera_id
             self.backup_camera_ids = backup_camera_ids or []
             self.camera_options = [camera_id] + self.backup_camera_ids
             
+            # Recent _list_available_cameras result as (max_to_check, time, IDs)
+            self.camera_probe_ttl = 30.0
+            self._available_cameras: Optional[Tuple[int, float, List[int]]] = None
+            
             # Initialize alert manager
             self.alert_manager = AlertManager(app_name="BadBits")
             
+            # Reuse image encodings across near-identical frames
+            self.vision_cache = VisionCache()
+            
+            # Skip inference entirely while the scene stays the same, and smooth
+            # answers over the last few model runs to suppress flicker
+            self.frame_ring = FrameRing()
+            self.vote_window = 3
+            self._votes: Dict[str, deque] = {}
+            self._last_results: List[AlertResult] = []
+            
+            # Ask all habits in one query; falls back to one query per habit
+            # after repeated answers that can't be parsed
+            self.max_combined_failures = 3
+            self._combined_failures = 0
+            self._combined_prompts: Dict[Tuple[str, ...], str] = {}
+            
             # Load habits - start with default habits
             self.habits = self._load_default_habits()
+            self._enabled_habits: Optional[List[HabitCheck]] = None
+            self._alert_texts: Dict[str, Tuple[str, str, str]] = {}
+            
+            # Remind about an unchanged set of issues at most this often
+            self.renotify_seconds = 300
+            self._last_notified: Optional[frozenset] = None
+            self._last_notified_at = 0.0
             
             # Try to load custom habits if specified
             if custom_habits_file:
@@ -875,33 +1917,79 @@ class HabitMonitor:
                     logger.warning(f"Failed to load custom habits: {e}")
             
             logger.info("Loading Moondream model...")
+            # Imported here since it is slow and only needed to run the model
+            import moondream as md
             self.model = md.vl(model=str(self.model_path))
             logger.info("Model loaded successfully")
             
+            # Tokenize the fixed habit prompts once instead of on every query
+            tokenizer = getattr(self.model, "tokenizer", None)
+            if tokenizer is not None:
+                self.model.tokenizer = PromptTokenCache(
+                    tokenizer, [habit.prompt for habit in self.habits.values()]
+                )
+            
+            # Warm the model up while the reference posture is being captured
+            self._warmup: Optional[Thread] = Thread(
+                target=self._warm_up_model, name="bb-warmup", daemon=True
+            )
+            self._warmup.start()
+            
             # Try to initialize webcam with primary and backup options if needed
-            self.cap = None
-            
-            for cam_id in self.camera_options:
-                logger.info(f"Trying camera with ID {cam_id}...")
-                self.cap = cv2.VideoCapture(cam_id)
-                if self.cap.isOpened():
-                    self.camera_id = cam_id
-                    logger.info(f"Successfully connected to camera with ID {cam_id}")
-                    break
-                else:
-                    self.cap.release()
+            self.cap = self._open_first_camera()
             
-            if self.cap is None or not self.cap.isOpened():
+            if self.cap is None:
                 available_cameras = self._list_available_cameras()
                 if available_cameras:
                     raise RuntimeError(f"Could not open any specified webcams. Available camera IDs might be: {available_cameras}")
                 else:
                     raise RuntimeError("Could not open any webcams. Please check your camera connections.")
             
+            # Read frames in the background so checks never wait on the camera
+            self._grabber: Optional[FrameGrabber] = None
+            self._start_grabber()
+            
+            # Dashboard layout depends only on the terminal width, which can only
+            # change on SIGWINCH; signal handlers can only be set from the main thread
+            self._layout: Optional[Tuple[int, str, str]] = None
+            self._chrome: Optional[Tuple[int, List[str], List[str], str, str]] = None
+            self._screen_lines: Optional[List[str]] = None
+            self._layout_cached = (hasattr(signal, "SIGWINCH")
+                                   and current_thread() is main_thread())
+            if self._layout_cached:
+                signal.signal(signal.SIGWINCH, self._on_terminal_resize)
+            
         except Exception as e:
             logger.error(f"Failed to initialize: {e}")
             raise
             
+    def _warm_up_model(self) -> None:
+        """
+        Run one throwaway inference so the first real check is not the slow one.
+        
+        ONNX Runtime allocates its buffers and picks kernels on the first
+        run of each session. A blank image at the largest tiling the model
+        uses sizes those buffers for real collages.
+        """
+        try:
+            start = time.perf_counter()
+            blank = Image.new('RGB', (VISION_MAX_SIDE, VISION_MAX_SIDE))
+            encoded_image = self.model.encode_image(blank)
+            if self.habits:
+                prompt = next(iter(self.habits.values())).prompt
+            else:
+                prompt = "Describe the image."
+            self.model.query(encoded_image, prompt, settings={"max_tokens": 1})
+            logger.debug(f"Model warm-up took {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            logger.warning(f"Model warm-up failed: {e}")
+    
+    def _wait_for_warmup(self) -> None:
+        """Block until the background model warm-up has finished."""
+        if self._warmup is not None:
+            self._warmup.join()
+            self._warmup = None
+    
     def _load_default_habits(self) -> Dict[str, HabitCheck]:
         """
         Load the default set of habit checks.
@@ -975,6 +2063,8 @@ class HabitMonitor:
             for habit_data in custom_data:
                 habit = HabitCheck.from_dict(habit_data)
                 self.habits[habit.habit_id] = habit
+            self._enabled_habits = None
+            self._alert_texts.clear()
                 
             logger.info(f"Loaded {len(custom_data)} custom habits from {custom_file}")
             
@@ -992,8 +2082,7 @@ class HabitMonitor:
         """
         habits_data = [habit.to_dict() for habit in self.habits.values()]
         
-        with open(output_file, 'w') as f:
-            json.dump(habits_data, f, indent=2)
+        Path(output_file).write_bytes(dumps_json(habits_data))
         
         logger.info(f"Saved {len(habits_data)} habits to {output_file}")
     
@@ -1010,8 +2099,16 @@ class HabitMonitor:
         """
         if habit_id in self.habits:
             self.habits[habit_id].enabled = enabled
+            self._enabled_habits = None
             return True
         return False
+    
+    @property
+    def enabled_habits(self) -> List[HabitCheck]:
+        """Enabled habits in definition order, rebuilt only after enable_habit."""
+        if self._enabled_habits is None:
+            self._enabled_habits = [habit for habit in self.habits.values() if habit.enabled]
+        return self._enabled_habits
             
     def _list_available_cameras(self, max_to_check: int = 5) -> List[int]:
         """
@@ -1023,17 +2120,80 @@ class HabitMonitor:
         Returns:
             List of available camera IDs
         """
-        available = []
-        for i in range(max_to_check):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                available.append(i)
-                cap.release()
+        # Failed checks retry every interval; don't probe all devices each time
+        cached = self._available_cameras
+        if (cached is not None and cached[0] == max_to_check
+                and time.monotonic() - cached[1] < self.camera_probe_ttl):
+            return cached[2]
+        
+        # Opening a missing device can block for a while, so probe in parallel
+        with ThreadPoolExecutor(max_workers=max_to_check, thread_name_prefix="bb-probe") as pool:
+            results = pool.map(self._probe_camera, range(max_to_check))
+        available = [camera_id for camera_id, is_open in enumerate(results) if is_open]
+        self._available_cameras = (max_to_check, time.monotonic(), available)
         return available
+    
+    def _open_first_camera(self) -> Optional[cv2.VideoCapture]:
+        """
+        Open the first camera in camera_options that works.
+        
+        All options are opened at once, since a missing device can block
+        for seconds; the earliest one in the list that opened wins and the
+        others are released. Sets camera_id to the camera that was opened.
+        
+        Returns:
+            Opened VideoCapture, or None if no option could be opened
+        """
+        logger.info(f"Trying cameras with IDs {self.camera_options}...")
+        with ThreadPoolExecutor(max_workers=len(self.camera_options),
+                                thread_name_prefix="bb-open") as pool:
+            caps = list(pool.map(open_camera, self.camera_options))
+        
+        chosen = None
+        for cam_id, cap in zip(self.camera_options, caps, strict=True):
+            if chosen is None and cap.isOpened():
+                chosen = cap
+                self.camera_id = cam_id
+                logger.info(f"Successfully connected to camera with ID {cam_id}")
+            else:
+                cap.release()
+        return chosen
+    
+    @staticmethod
+    def _probe_camera(camera_id: int) -> bool:
+        """
+        Check whether a camera device can be opened.
+        
+        Args:
+            camera_id: Camera device ID to try
+            
+        Returns:
+            True if the camera opened successfully
+        """
+        cap = open_camera(camera_id)
+        try:
+            return cap.isOpened()
+        finally:
+            cap.release()
+
+    def _start_grabber(self) -> None:
+        """Start a background frame grabber for the current camera."""
+        self._stop_grabber()
+        configure_camera(self.cap)
+        self._grabber = FrameGrabber(self.cap)
+        self._grabber.start()
+    
+    def _stop_grabber(self) -> None:
+        """Stop the background frame grabber, if running."""
+        grabber = getattr(self, '_grabber', None)
+        if grabber is not None:
+            grabber.stop()
+            self._grabber = None
 
     def __del__(self):
         """Cleanup webcam resources"""
-        if hasattr(self, 'cap'):
+        self._stop_grabber()
+        if getattr(self, 'cap', None) is not None:
             self.cap.release()
 
     def capture_frame(self) -> Image.Image:
@@ -1041,7 +2201,8 @@ class HabitMonitor:
         Capture a frame from the webcam and convert to PIL Image.
         
         Returns:
-            PIL Image object containing the current webcam frame
+            PIL Image object containing the current webcam frame, downscaled to
+            at most VISION_MAX_SIDE pixels on its longest side
             
         Raises:
             RuntimeError: If frame capture fails after trying all cameras
@@ -1052,27 +2213,23 @@ class HabitMonitor:
         for attempt in range(max_attempts):
             # Check if camera is still open
             if not self.cap.isOpened():
-                logger.warning(f"Webcam connection lost. Attempting to reconnect (attempt {attempt+1}/{max_attempts})...")
+                logger.warning("Webcam connection lost. Attempting to reconnect (attempt %d/%d)...",
+                               attempt + 1, max_attempts)
+                
+                # Release previous cap if it exists
+                self._stop_grabber()
+                if hasattr(self, 'cap') and self.cap is not None:
+                    self.cap.release()
                 
                 # Try each of our camera options
-                for cam_id in self.camera_options:
-                    logger.info(f"Trying camera with ID {cam_id}...")
-                    
-                    # Release previous cap if it exists
-                    if hasattr(self, 'cap') and self.cap is not None:
-                        self.cap.release()
-                    
-                    # Try to connect to this camera
-                    time.sleep(1)
-                    self.cap = cv2.VideoCapture(cam_id)
-                    
-                    if self.cap.isOpened():
-                        logger.info(f"Successfully reconnected to camera with ID {cam_id}")
-                        self.camera_id = cam_id
-                        break
+                time.sleep(1)
+                cap = self._open_first_camera()
+                if cap is not None:
+                    self.cap = cap
+                    self._start_grabber()
                 
                 # If we couldn't connect to any camera
-                if not self.cap.isOpened():
+                if cap is None:
                     if attempt == max_attempts - 1:
                         available_cameras = self._list_available_cameras()
                         if available_cameras:
@@ -1081,21 +2238,79 @@ class HabitMonitor:
                             raise RuntimeError("Failed to connect to any camera. Please check your camera connections.")
                     continue
             
-            # Try to capture frame
-            ret, frame = self.cap.read()
-            if ret:
-                # Convert BGR to RGB for PIL
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                return Image.fromarray(rgb_frame)
+            # Take the freshest frame from the background grabber
+            frame = self._grabber.read(timeout=2.0) if self._grabber is not None else None
+            if frame is not None:
+                # Shrink to what the model can use and convert BGR to RGB for PIL
+                return prepare_vision_input(frame)
             
             # If we failed but have more attempts
             if attempt < max_attempts - 1:
-                logger.warning(f"Frame capture failed. Retrying ({attempt+1}/{max_attempts})...")
+                logger.warning("Frame capture failed. Retrying (%d/%d)...",
+                               attempt + 1, max_attempts)
                 time.sleep(1)
         
         # If we get here, all attempts failed
         raise RuntimeError("Failed to capture frame from webcam after multiple attempts with all cameras")
 
+    def _reference_half(self, width: int, height: int) -> np.ndarray:
+        """
+        Get the top half of the collage: the framed, labelled reference image.
+        
+        The result is cached, since it only changes when a new reference is
+        captured or the frame size changes.
+        
+        Args:
+            width: Collage width in pixels
+            height: Height of each image in the collage
+            
+        Returns:
+            RGB array of the reference image and the white strip below it
+        """
+        if self._reference_top is not None and self._reference_top.shape[:2] == (
+                height + self.COLLAGE_GAP, width):
+            return self._reference_top
+        
+        ref_resized = cv2.resize(np.asarray(self.reference_image), (width, height),
+                                 interpolation=cv2.INTER_AREA)
+        border_width = self.COLLAGE_BORDER
+        
+        # White strip below a black-framed image. The canvas is only as wide
+        # as the image, so the right edge of the frame is cut off.
+        top = np.full((height + self.COLLAGE_GAP, width, 3), 255, dtype=np.uint8)
+        top[:height + 2 * border_width] = 0
+        top[border_width:height + border_width, border_width:] = (
+            ref_resized[:, :width - border_width]
+        )
+        
+        top_image = Image.fromarray(top)
+        ImageDraw.Draw(top_image).text((10, height//2 - 20), "Reference Posture",
+                                       fill='black', font=self._label_font)
+        self._reference_top = np.asarray(top_image)
+        return self._reference_top
+    
+    def _collage_size(self, current_size: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Get the size each image is drawn at in the collage.
+        
+        Args:
+            current_size: Current frame size as (width, height)
+            
+        Returns:
+            Tuple of (width, height) for each half, before the gap below the top
+        """
+        # Ensure both images are the same size
+        width = max(self.reference_image.width, current_size[0])
+        height = max(self.reference_image.height, current_size[1])
+        
+        # The model never sees more than VISION_MAX_SIDE pixels along a side,
+        # so shrink both halves until the whole collage fits
+        max_height = (VISION_MAX_SIDE - self.COLLAGE_GAP) // 2
+        if height > max_height:
+            width = width * max_height // height
+            height = max_height
+        return width, height
+    
     def create_collage(self, current_image: Image.Image) -> Image.Image:
         """
         Create a collage with reference image on top and current image below.
@@ -1104,7 +2319,8 @@ class HabitMonitor:
             current_image: The current webcam frame as PIL Image
             
         Returns:
-            A collage image containing reference and current images
+            A collage image containing reference and current images, at most
+            VISION_MAX_SIDE pixels tall
             
         Raises:
             RuntimeError: If reference image has not been set
@@ -1112,47 +2328,226 @@ class HabitMonitor:
         if self.reference_image is None:
             raise RuntimeError("Reference image not set")
         
-        # Ensure both images are the same size
-        width = max(self.reference_image.width, current_image.width)
-        height = max(self.reference_image.height, current_image.height)
+        width, height = self._collage_size(current_image.size)
+        
+        # Resize with OpenCV straight from the frame's pixel buffer
+        curr_resized = np.asarray(current_image)
+        if current_image.size != (width, height):
+            curr_resized = cv2.resize(curr_resized, (width, height), interpolation=cv2.INTER_AREA)
+        
+        border_height = self.COLLAGE_GAP
+        border_width = self.COLLAGE_BORDER
+        bottom = height + border_height
+        
+        # Fill the same buffer every check; Image.fromarray copies RGB
+        # arrays, so earlier collages never see it change
+        shape = (height * 2 + border_height, width, 3)
+        collage_array = self._collage_buffer
+        if collage_array is None or collage_array.shape != shape:
+            collage_array = self._collage_buffer = np.empty(shape, dtype=np.uint8)
+        
+        # The top half only depends on the reference, so it is copied in
+        # as-is and only the bottom half is drawn for each check
+        collage_array[:bottom] = self._reference_half(width, height)
+        collage_array[bottom:] = 0
+        collage_array[bottom + border_width:, border_width:] = (
+            curr_resized[:height - border_width, :width - border_width]
+        )
+        collage = Image.fromarray(collage_array)
+        
+        # Add labels with larger font
+        draw = ImageDraw.Draw(collage)
+        draw.text((10, height * 1.5 + border_height - 20), "Current Posture", fill='black',
+                  font=self._label_font)
+        
+        return collage
+
+    def _query_habits(self, encoded_image: Any, prompts: List[str]) -> List[str]:
+        """
+        Run all habit prompts against a single encoded image.
+        
+        The prompts are combined into a single numbered question, so the
+        decoder runs once per check instead of once per habit. If that answer
+        can't be parsed, the prompts are asked one after another against the
+        shared encoding.
+        
+        Args:
+            encoded_image: Image encoding returned by the vision model
+            prompts: Habit prompts to ask, in order
+            
+        Returns:
+            Raw answer strings, one per prompt
+        """
+        if len(prompts) > 1 and self._combined_failures < self.max_combined_failures:
+            response = self.model.query(
+                encoded_image, self._combined_prompt(prompts),
+                settings={"max_tokens": self.ANSWER_MAX_TOKENS * len(prompts)}
+            )["answer"]
+            answers = self._parse_combined_answer(response, len(prompts))
+            if answers is not None:
+                self._combined_failures = 0
+                return answers
+            
+            self._combined_failures += 1
+            logger.warning("Could not parse combined answer %r; asking habits one by one", response)
+            if self._combined_failures >= self.max_combined_failures:
+                logger.info("Combined habit queries keep failing; using one query per habit")
+        
+        settings = {"max_tokens": self.ANSWER_MAX_TOKENS}
+        return [self.model.query(encoded_image, prompt, settings=settings)["answer"]
+                for prompt in prompts]
+    
+    def _combined_prompt(self, prompts: List[str]) -> str:
+        """
+        Build a single prompt that asks every habit question at once.
+        
+        Args:
+            prompts: Habit prompts to combine, in order
+            
+        Returns:
+            Numbered prompt asking for one yes/no answer per line
+        """
+        key = tuple(prompts)
+        combined = self._combined_prompts.get(key)
+        if combined is None:
+            # Drop each prompt's own answer-format instruction; the combined
+            # prompt gives its own
+            questions = [
+                re.sub(r"\s*Answer with ONLY.*$", "", prompt, flags=re.IGNORECASE)
+                for prompt in prompts
+            ]
+            combined = (
+                "Answer each numbered question with only 'yes' or 'no', "
+                "one answer per line, like '1. no'.\n"
+                + "\n".join(f"{i}. {question}" for i, question in enumerate(questions, 1))
+            )
+            self._combined_prompts[key] = combined
+            
+            # Tokenize it once, like the individual habit prompts
+            tokenizer = getattr(self.model, "tokenizer", None)
+            if isinstance(tokenizer, PromptTokenCache):
+                tokenizer.add([combined])
+        return combined
+    
+    @staticmethod
+    def _parse_combined_answer(response: str, count: int) -> Optional[List[str]]:
+        """
+        Split a combined answer into one yes/no answer per question.
         
-        ref_resized = self.reference_image.resize((width, height))
-        curr_resized = current_image.resize((width, height))
+        Args:
+            response: Raw answer to a prompt from _combined_prompt
+            count: Number of questions that were asked
+            
+        Returns:
+            Answers in question order, or None if the response doesn't answer
+            every question exactly once
+        """
+        answers: Dict[int, str] = {}
+        for line in response.splitlines():
+            match = re.match(r"\s*(\d+)\s*[.):-]?\s*(yes|no)\b", line, re.IGNORECASE)
+            if match:
+                answers.setdefault(int(match.group(1)), match.group(2).lower())
         
-        # Create larger white strip for middle border (50 pixels high)
-        border_height = 50
+        if sorted(answers) != list(range(1, count + 1)):
+            return None
+        return [answers[i] for i in range(1, count + 1)]
+
+    @staticmethod
+    def _normalize_answer(answer: str) -> str:
+        """
+        Reduce a model answer to "yes" or "no" when it starts with one.
         
-        # Add black borders (2 pixels) around images
-        border_width = 2
+        With a short decoding budget the model often stops at "Yes." or
+        "No, the", so only the leading word is compared.
         
-        # Create new image with space for both images, borders, and white strip
-        collage = Image.new('RGB', (width, height * 2 + border_height), 'white')
+        Args:
+            answer: Raw answer string from the model
+            
+        Returns:
+            "yes", "no", or the stripped lowercased answer if it starts with neither
+        """
+        answer = answer.lower().strip()
+        match = re.match(r"(yes|no)\b", answer)
+        return match.group(1) if match else answer
+    
+    def _vote(self, habit_id: str, is_active: bool) -> bool:
+        """
+        Smooth a habit's answer by majority vote over its recent model runs.
         
-        # Create black borders for reference image
-        black_border_top = Image.new('RGB', (width + 2*border_width, height + 2*border_width), 'black')
-        black_border_top.paste(ref_resized, (border_width, border_width))
+        Args:
+            habit_id: Habit the answer belongs to
+            is_active: Latest answer from the model
+            
+        Returns:
+            Whether most of the last vote_window answers were positive
+        """
+        votes = self._votes.get(habit_id)
+        if votes is None:
+            votes = self._votes[habit_id] = deque(maxlen=self.vote_window)
+        votes.append(is_active)
+        return sum(votes) * 2 > len(votes)
+    
+    def _static_results(self, frame_hash: int) -> Optional[List[AlertResult]]:
+        """
+        Record a frame and reuse the previous results if the scene is static.
         
-        # Create black borders for current image
-        black_border_bottom = Image.new('RGB', (width + 2*border_width, height + 2*border_width), 'black')
-        black_border_bottom.paste(curr_resized, (border_width, border_width))
+        Args:
+            frame_hash: Perceptual hash of the current frame
+            
+        Returns:
+            Previous results restamped to now, or None if the model should run
+        """
+        self.frame_ring.push(frame_hash)
         
-        # Paste bordered images
-        collage.paste(black_border_top, (0, 0))
-        collage.paste(black_border_bottom, (0, height + border_height))
+        # While nothing in view has changed, the model would only repeat itself
+        habit_ids = [habit.habit_id for habit in self.enabled_habits]
+        if (not habit_ids or self.frame_ring.should_infer()
+                or [result.alert_type for result in self._last_results] != habit_ids):
+            return None
         
-        # Add labels with larger font
-        draw = ImageDraw.Draw(collage)
-        draw.text((10, height//2 - 20), "Reference Posture", fill='black')
-        draw.text((10, height * 1.5 + border_height - 20), "Current Posture", fill='black')
+        logger.debug("Scene static, reusing previous results")
+        now_ns = time.time_ns()
+        return [
+            AlertResult(
+                alert_type=result.alert_type,
+                is_active=result.is_active,
+                details=result.details,
+                timestamp_ns=now_ns
+            )
+            for result in self._last_results
+        ]
+    
+    def check_frame(self,
+                    current_image: Image.Image) -> Tuple[Optional[Image.Image], List[AlertResult]]:
+        """
+        Check a webcam frame, building the collage only if the model has to run.
         
-        return collage
-
-    def analyze_habits(self, collage: Image.Image) -> List[AlertResult]:
+        Args:
+            current_image: Frame from capture_frame
+            
+        Returns:
+            Tuple of (collage, alerts); collage is None when the scene was
+            static and the previous results were reused
+        """
+        frame_hash = perceptual_hash(current_image)
+        static_results = self._static_results(frame_hash)
+        if static_results is not None:
+            return None, static_results
+        
+        collage = self.create_collage(current_image)
+        return collage, self.analyze_habits(collage, frame_hash=frame_hash)
+    
+    def analyze_habits(self, collage: Image.Image, frame_hash: int) -> List[AlertResult]:
         """
         Analyze habits in the collage image using the vision model.
         
+        Answers are majority-voted over the last few model runs so a single
+        odd answer doesn't raise an alert.
+        
         Args:
             collage: The composite image containing reference and current posture
+            frame_hash: perceptual_hash of the frame the collage was built
+                from, as check_frame records it
             
         Returns:
             List of AlertResult objects for each detected behavior
@@ -1161,41 +2556,51 @@ class HabitMonitor:
             Exception: If image analysis fails
         """
         try:
-            encoded_image = self.model.encode_image(collage)
-            
-            now = datetime.now()
+            now_ns = time.time_ns()
             results: List[AlertResult] = []
             
-            # Process each enabled habit
-            for habit_id, habit in self.habits.items():
-                # Skip disabled habits
-                if not habit.enabled:
-                    continue
-                
-                # Process the habit check
-                response = self.model.query(encoded_image, habit.prompt)
-                answer = response["answer"].lower().strip()
-                
-                # Create a binary result (is_active = True means the alert is active)
-                # Strictly enforce binary yes/no - only "yes" counts as positive
-                is_active = answer.strip().lower() == "yes"
+            enabled_habits = self.enabled_habits
+            
+            if enabled_habits:
+                # Don't compete with the warm-up run for the model
+                self._wait_for_warmup()
                 
-                # Log if we got unexpected response
-                if answer.strip().lower() not in ["yes", "no"]:
-                    logger.warning(f"Non-binary response from model for {habit_id}: '{answer}'. Treated as 'no'.")
+                # Skip the vision encoder when the scene hasn't changed. The
+                # reference half is the same in every collage (the cache is
+                # cleared when it changes), so the frame's hash is the key.
+                encoded_image = self.vision_cache.lookup(frame_hash)
+                if encoded_image is None:
+                    encoded_image = self.model.encode_image(collage)
+                    self.vision_cache.store(frame_hash, encoded_image)
+                else:
+                    logger.debug("Scene unchanged, reusing cached image encoding")
                 
-                # No details needed - keep alerts simple and binary
-                details = ""
+                # Encode once, then ask every habit prompt against the same encoding
+                prompts = [habit.prompt for habit in enabled_habits]
+                answers = self._query_habits(encoded_image, prompts)
                 
-                # Create the alert result
-                result = AlertResult(
-                    alert_type=habit_id,
-                    is_active=is_active,
-                    details=details,
-                    timestamp=now
-                )
+                for habit, answer in zip(enabled_habits, answers, strict=True):
+                    answer = self._normalize_answer(answer)
+                    
+                    # Create a binary result (is_active = True means the alert is active)
+                    # Strictly enforce binary yes/no - only "yes" counts as positive
+                    is_active = answer == "yes"
+                    
+                    # Log if we got unexpected response
+                    if answer not in ["yes", "no"]:
+                        logger.warning("Non-binary response from model for %s: '%s'. "
+                                       "Treated as 'no'.", habit.habit_id, answer)
+                    
+                    # No details needed - keep alerts simple and binary
+                    results.append(AlertResult(
+                        alert_type=habit.habit_id,
+                        is_active=self._vote(habit.habit_id, is_active),
+                        details="",
+                        timestamp_ns=now_ns
+                    ))
                 
-                results.append(result)
+                self.frame_ring.mark_inference()
+                self._last_results = results
             
             # If we have no enabled habits, add a dummy result
             if not results:
@@ -1203,13 +2608,13 @@ class HabitMonitor:
                     alert_type="no_checks",
                     is_active=False,
                     details="No habit checks enabled",
-                    timestamp=now
+                    timestamp_ns=now_ns
                 ))
             
             return results
                 
         except Exception as e:
-            logger.error(f"Failed to analyze image: {e}")
+            logger.error("Failed to analyze image: %s", e)
             raise
 
     def capture_reference(self):
@@ -1222,18 +2627,23 @@ class HabitMonitor:
         print("3. The photo will be taken while you're typing!")
         print("\nGet ready and start typing 'yellow' when you're in position...")
         
-        # Store original terminal settings
-        old_settings = termios.tcgetattr(sys.stdin)
-        try:
-            # Set terminal to raw mode
-            tty.setraw(sys.stdin.fileno())
-            
+        # Read keys one at a time without waiting for Enter; the photo is
+        # taken on a worker thread so typing is never held up by the camera
+        with raw_tty(sys.stdin) as interactive, ThreadPoolExecutor(max_workers=1) as pool:
             target_word = "yellow"
             typed = ""
-            capture_done = False
+            capture: Optional["Future[Image.Image]"] = None
             
             while len(typed) < len(target_word):
-                char = sys.stdin.read(1)
+                if interactive:
+                    # Poll for keys rather than blocking on stdin
+                    char = read_key(sys.stdin, 0.1)
+                    if char is None:
+                        continue
+                else:
+                    char = sys.stdin.read(1)
+                if not char:
+                    raise EOFError("Input ended before the reference word was typed")
                 # Exit on Ctrl-C
                 if ord(char) == 3:
                     raise KeyboardInterrupt
@@ -1243,37 +2653,46 @@ class HabitMonitor:
                 sys.stdout.flush()
                 
                 # Take photo around the middle of the word
-                if len(typed) == len(target_word) // 2 and not capture_done:
-                    self.reference_image = self.capture_frame()
-                    capture_done = True
+                if len(typed) == len(target_word) // 2 and capture is None:
+                    capture = pool.submit(self.capture_frame)
             
-        finally:
-            # Restore terminal settings
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+            self.reference_image = capture.result()
+            self._reference_top = None
+            
+            # Encodings and answers from the old reference no longer apply
+            self.vision_cache.clear()
+            self.frame_ring.clear()
+            self._votes.clear()
+            self._last_results = []
         
         print("\n\nReference image captured! 📸")
         
+        # Draw the reference half of the collage now rather than on the first
+        # check, at the size a frame from the same camera will need
+        self._reference_half(*self._collage_size(self.reference_image.size))
+        
         # Save reference image
         ref_path = self.output_dir / "reference_posture.jpg"
         self.reference_image.save(ref_path)
         print(f"Reference image saved to: {ref_path}")
         
         # Send a notification that monitoring is starting
-        if hasattr(self, 'alert_manager'):
-            self.alert_manager.send_alert(
-                "BadBits Monitoring Started",
-                "Posture and habit monitoring is now active!",
-                ['desktop', 'system']
-            )
+        self.alert_manager.send_alert(
+            "BadBits Monitoring Started",
+            "Posture and habit monitoring is now active!",
+            ['desktop', 'system']
+        )
             
         print("\nStarting posture monitoring...")
 
-    def save_analysis(self, collage: Image.Image, alerts: List[AlertResult], timestamp: str, archive_mode: bool = False) -> Optional[Path]:
+    def save_analysis(self, collage: Optional[Image.Image], alerts: List[AlertResult],
+                      timestamp: str, archive_mode: bool = False) -> Optional[Path]:
         """
         Save the collage and analysis results to a timestamped directory if archiving is enabled.
         
         Args:
-            collage: The comparison image to save
+            collage: The comparison image to save, or None if the check reused
+                earlier results and built no collage
             alerts: List of AlertResult objects
             timestamp: Timestamp string for the directory name
             archive_mode: Whether to save data to disk (privacy protection)
@@ -1285,66 +2704,171 @@ class HabitMonitor:
         if not archive_mode:
             return None
             
-        # Create the analysis directory
-        analysis_dir = self.output_dir / timestamp
-        analysis_dir.mkdir(exist_ok=True)
-        
-        # Save the collage image
-        collage_path = analysis_dir / "comparison.jpg"
-        collage.save(collage_path)
-        
-        # Convert alerts to dictionary for JSON serialization
+        # Alerts and datetimes are converted by the JSON encoder itself
         results_dict = {
-            "timestamp": datetime.now().isoformat(),
-            "alerts": [alert.to_dict() for alert in alerts]
+            "timestamp": datetime.now(),
+            "alerts": alerts
         }
         
-        # Save the analysis results
-        results_path = analysis_dir / "analysis.json"
-        with open(results_path, 'w') as f:
-            json.dump(results_dict, f, indent=2)
+        # Encoding and writing happen in the background; each collage is
+        # built fresh per check, so it won't change underneath the writer
+        analysis_dir = self.output_dir / timestamp
+        self._archive_pool.submit(self._write_analysis, analysis_dir, collage, results_dict)
             
         return analysis_dir
+    
+    @staticmethod
+    def _write_analysis(analysis_dir: Path, collage: Optional[Image.Image],
+                        results_dict: Dict[str, Any]) -> None:
+        """
+        Write one check's collage and results to disk.
+        
+        Args:
+            analysis_dir: Directory for this check
+            collage: The comparison image to save, if any
+            results_dict: Analysis results to save as JSON
+        """
+        try:
+            analysis_dir.mkdir(exist_ok=True)
+            if collage is not None:
+                collage.save(analysis_dir / "comparison.jpg",
+                             quality=HabitMonitor.ARCHIVE_JPEG_QUALITY, subsampling=2)
+            # Written on every check, so kept compact
+            (analysis_dir / "analysis.json").write_bytes(dumps_json(results_dict, indent=False))
+        except Exception as e:
+            logger.error("Failed to save analysis to %s: %s", analysis_dir, e)
 
-    def send_alert_notification(self, alert: AlertResult) -> None:
+    def _alert_text(self, alert_type: AlertType) -> Tuple[str, str, str]:
         """
-        Send a desktop notification for an active alert.
+        Get the notification text for a habit, building it on first use.
         
         Args:
-            alert: The AlertResult to send a notification for
+            alert_type: Habit ID of the alert
+            
+        Returns:
+            Tuple of (title, message, prefix to put before alert details)
         """
-        if not alert.is_active:
-            return
+        text = self._alert_texts.get(alert_type)
+        if text is None:
+            habit = self.habits.get(alert_type)
+            
+            # Create the notification title
+            if habit:
+                title = f"BadBits Alert: {habit.get_display_name()}"
+            else:
+                title = f"BadBits Alert: {format_alert_type(alert_type)}"
             
-        # Get the habit details if available
-        habit = self.habits.get(alert.alert_type)
+            # Use the custom message from the habit definition if it has one
+            if habit and habit.active_message:
+                text = (title, habit.active_message, f"{habit.active_message} ")
+            else:
+                text = (title, "Issue detected!", "Issue detected: ")
+            self._alert_texts[alert_type] = text
+        return text
+    
+    def _notify_active_alerts(self, alerts: List[AlertResult], methods: List[str]) -> None:
+        """
+        Send one notification covering every active alert from a check.
         
-        # Create the notification title
-        if habit:
-            alert_name = habit.get_display_name()
-            title = f"BadBits Alert: {alert_name}"
-        else:
-            title = f"BadBits Alert: {alert.alert_type.replace('_', ' ').title()}"
+        The same set of issues isn't announced again until renotify_seconds
+        have passed, so a lasting issue gets reminders rather than a
+        notification on every check.
         
-        # Create the notification message - simple and direct
-        if habit and habit.active_message:
-            # Use the custom message from the habit definition, no details needed
-            message = habit.active_message
-        else:
-            # Default message if habit is not found
-            message = "Issue detected!"
+        Args:
+            alerts: Results of the latest check
+            methods: Alert methods to use in priority order
+        """
+        active = [alert for alert in alerts if alert.is_active]
+        if not active:
+            self._last_notified = None
+            return
         
-        # Initialize alert manager if needed
-        if not hasattr(self, 'alert_manager'):
-            self.alert_manager = AlertManager(app_name="BadBits")
+        notified = frozenset(alert.alert_type for alert in active)
+        now = time.monotonic()
+        if notified == self._last_notified and now - self._last_notified_at < self.renotify_seconds:
+            return
+        self._last_notified = notified
+        self._last_notified_at = now
+        
+        messages = []
+        for alert in active:
+            title, message, details_prefix = self._alert_text(alert.alert_type)
             
-        # Send alert with fallbacks
+            # Append details if available
+            messages.append(details_prefix + alert.details if alert.details else message)
+        
+        if len(active) > 1:
+            title = "BadBits: Multiple Issues"
+        
+        # Send alert using the specified methods
         self.alert_manager.send_alert(
             title=title,
-            message=message,
-            methods=['desktop', 'system', 'browser', 'sound']
+            message=" ".join(messages),
+            methods=methods
         )
     
+    def _on_terminal_resize(self, signum: int, frame: Any) -> None:
+        """Forget the cached terminal layout when the window is resized."""
+        self._layout = None
+        # Rewrapped lines no longer sit where the last redraw put them
+        self._screen_lines = None
+    
+    def _terminal_layout(self) -> Tuple[int, str, str]:
+        """
+        Get the dashboard width with the solid and dotted rules that span it.
+        
+        The width is one column short of the terminal, so no line fills the
+        last column and wraps. Cached between renders while a SIGWINCH
+        handler can reset it.
+        
+        Returns:
+            Tuple of (width, solid rule, dotted rule)
+        """
+        layout = self._layout
+        if layout is None:
+            width = shutil.get_terminal_size().columns - 1
+            layout = (width, "─" * width, "┄" * width)
+            if self._layout_cached:
+                self._layout = layout
+        return layout
+    
+    def _dashboard_chrome(self, terminal_width: int,
+                          border: str) -> Tuple[List[str], List[str], str, str]:
+        """
+        Get the dashboard parts that depend only on the terminal width.
+        
+        The result for the last width seen is kept, so centering the
+        header and footer and building the bars happens once rather than
+        on every render. Progress bars are drawn by slicing the full-width
+        filled and empty bars.
+        
+        Args:
+            terminal_width: Current terminal width
+            border: Solid rule spanning the terminal
+            
+        Returns:
+            Tuple of (header lines, footer lines, filled bar, empty bar)
+        """
+        chrome = self._chrome
+        if chrome is None or chrome[0] != terminal_width:
+            title = f"{Colors.BOLD}BadBits Monitor{Colors.RESET}"
+            subtitle = "Posture and habit tracking"
+            header = [
+                border,
+                title.center(terminal_width),
+                subtitle.center(terminal_width),
+                border
+            ]
+            footer = [
+                border,
+                "Press q or Ctrl+C to exit · c to check now".center(terminal_width),
+                border
+            ]
+            bar_width = min(terminal_width - 40, 25)  # Smaller bar to fit everything
+            chrome = (terminal_width, header, footer, "■" * bar_width, "·" * bar_width)
+            self._chrome = chrome
+        return chrome[1], chrome[2], chrome[3], chrome[4]
+    
     def render_dashboard(self, 
                          stats: CheckStats,
                          current_alerts: List[AlertResult], 
@@ -1362,29 +2886,11 @@ class HabitMonitor:
         Returns:
             Formatted string for terminal display
         """
-        # Get terminal size
-        terminal_width = shutil.get_terminal_size().columns
-        
-        # Limited color palette for a clean, cohesive look
-        class Colors:
-            RESET = "\033[0m"
-            BOLD = "\033[1m"
-            DIM = "\033[2m"  # Dimmed text
-            BLUE = "\033[34m"  # Standard blue (not bright)
-            GREEN = "\033[32m"  # Standard green
-            RED = "\033[31m"  # Standard red
-            WHITE = "\033[37m"  # White
-            
-        # Clean header
-        border = "─" * terminal_width
-        title = f"{Colors.BOLD}BadBits Monitor{Colors.RESET}"
-        subtitle = "Posture and habit tracking"
-        header = [
-            border,
-            title.center(terminal_width),
-            subtitle.center(terminal_width),
-            border
-        ]
+        # Get terminal size and the rules drawn across it
+        terminal_width, border, dotted = self._terminal_layout()
+        
+        # Clean header and footer, centered once per terminal width
+        header, footer, full_bar, empty_bar = self._dashboard_chrome(terminal_width, border)
         
         # Simple status line with live indicator
         current_time = datetime.now().strftime("%H:%M:%S")
@@ -1401,16 +2907,14 @@ class HabitMonitor:
         # Combined section for habits - status and history together
         habits_section = [
             f"{Colors.BOLD}Habit Monitoring{Colors.RESET}",
-            "┄" * terminal_width
+            dotted
         ]
         
         # Map alerts to habits for easier lookup
-        alert_by_habit = {}
-        for alert in current_alerts:
-            alert_by_habit[alert.alert_type] = alert
+        alert_by_habit = {alert.alert_type: alert for alert in current_alerts}
             
         # Get all active habits
-        active_habits = [habit_id for habit_id, habit in self.habits.items() if habit.enabled]
+        active_habits = self.enabled_habits
         
         if not active_habits:
             habits_section.append("No habits being monitored")
@@ -1419,60 +2923,53 @@ class HabitMonitor:
         else:
             # Show each habit with all its information in one unified display
             max_checks = min(20, stats.total_checks)  # Show up to last 20 checks
-            bar_width = min(terminal_width - 40, 25)  # Smaller bar to fit everything
+            bar_width = len(full_bar)
+            
+            # Work out every habit's counts and percentages in one pass
+            alert_counts = stats.habit_alerts
+            percents = dict(zip(stats.habit_types, stats.get_alert_percents().tolist(),
+                                strict=True))
             
-            for habit_id in active_habits:
-                habit = self.habits[habit_id]
-                percent = stats.get_alert_percent(habit_id)
+            for habit in active_habits:
+                habit_id = habit.habit_id
+                percent = percents.get(habit_id, 0)
                 
                 # Current status indicator
                 current_alert = alert_by_habit.get(habit_id)
-                if current_alert and current_alert.is_active:
-                    status_indicator = f"{Colors.RED}! NEEDS ATTENTION{Colors.RESET}"
-                else:
-                    status_indicator = f"{Colors.GREEN}✓ Good{Colors.RESET}"
+                is_active = bool(current_alert and current_alert.is_active)
+                status_indicator = STATUS_INDICATORS[is_active]
                 
                 # Display the habit name and current status
                 habits_section.append(f"\n{habit.emoji}  {Colors.BOLD}{habit.get_display_name()}{Colors.RESET}  {status_indicator}")
                 
                 # Create percentage bar
-                if percent > 50:
-                    percent_color = Colors.RED
-                elif percent > 25:
-                    percent_color = Colors.RED + Colors.DIM
-                else:
-                    percent_color = Colors.GREEN
+                percent_color = Colors.for_percent(percent)
                 
                 fill_width = int((percent / 100) * bar_width)
-                bar = f"[{percent_color}{'■' * fill_width}{Colors.RESET}{Colors.DIM}{'·' * (bar_width - fill_width)}{Colors.RESET}]"
+                bar = (f"[{percent_color}{full_bar[:fill_width]}{Colors.RESET}"
+                       f"{Colors.DIM}{empty_bar[fill_width:]}{Colors.RESET}]")
                 
                 # Add the percentage summary
                 habits_section.append(f"   Session issues: {percent_color}{percent:2d}%{Colors.RESET} {bar}")
                 
                 # Create timeline visualization - always show for all enabled habits
                 # Get alert count (default to 0 if not found)
-                alerts_count = stats.habit_alerts.get(habit_id, 0)
+                alerts_count = alert_counts.get(habit_id, 0)
                 alerts_per_check = alerts_count / stats.total_checks if stats.total_checks > 0 else 0
                 
-                # Build timeline string
-                timeline = ""
-                
-                for i in range(max_checks):
-                    check_index = stats.total_checks - max_checks + i
-                    
-                    # Determine if this check had an issue (approximation)
+                # Build timeline string, one mark per recent check
+                first_index = stats.total_checks - max_checks
+                if alerts_count > 0:
+                    # Determine if each check had an issue (approximation)
+                    timeline = "".join([
+                        TIMELINE_MARKS[(check_index % 3 == 0 and alerts_per_check > 0.3) or
+                                       (check_index % 7 == 0 and alerts_per_check > 0.1) or
+                                       (alerts_per_check > 0.5 and check_index % 2 == 0)]
+                        for check_index in range(first_index, stats.total_checks)
+                    ])
+                else:
                     # For habits with no issues recorded, show all green dots
-                    if alerts_count > 0:
-                        is_active = (check_index % 3 == 0 and alerts_per_check > 0.3) or \
-                                    (check_index % 7 == 0 and alerts_per_check > 0.1) or \
-                                    (alerts_per_check > 0.5 and check_index % 2 == 0)
-                    else:
-                        is_active = False
-                    
-                    if is_active:
-                        timeline += f"{Colors.RED}×{Colors.RESET}"
-                    else:
-                        timeline += f"{Colors.GREEN}·{Colors.RESET}"
+                    timeline = TIMELINE_MARKS[False] * max_checks
                 
                 # Add timeline with label
                 habits_section.append(f"   History: [{timeline}] (oldest → newest)")
@@ -1486,23 +2983,16 @@ class HabitMonitor:
         error_lines = []
         if error_message:
             error_lines = [
-                "┄" * terminal_width,
+                dotted,
                 f"{Colors.RED}Error: {error_message}{Colors.RESET}",
-                "┄" * terminal_width
+                dotted
             ]
             
-        # Footer
-        footer = [
-            border,
-            f"Press Ctrl+C to exit".center(terminal_width),
-            border
-        ]
-        
         # Combine all sections
         dashboard = []
         dashboard.extend(header)
         dashboard.append("")
-        dashboard.append(status_line.center(terminal_width))
+        dashboard.append(f"{status_line:^{terminal_width}}")
         dashboard.append("")
         dashboard.extend(habits_section)
         
@@ -1515,6 +3005,63 @@ class HabitMonitor:
         
         return "\n".join(dashboard)
                     
+    def _run_check(self, worker: AnalysisWorker,
+                   interactive: bool) -> Tuple[Optional[Image.Image], List[AlertResult]]:
+        """
+        Have the worker capture and analyze a frame, watching for q meanwhile.
+        
+        Args:
+            worker: Running analysis worker
+            interactive: Whether stdin is a terminal in cbreak mode
+            
+        Returns:
+            Tuple of (collage, alerts) for the check, as from check_frame
+            
+        Raises:
+            KeyboardInterrupt: If the user pressed q
+            Exception: Whatever the capture or analysis raised
+        """
+        worker.request_check()
+        while True:
+            try:
+                result = worker.results.get(timeout=0.1 if interactive else None)
+                break
+            except queue.Empty:
+                key = read_key(sys.stdin, 0)
+                if key is not None and key.lower() == "q":
+                    raise KeyboardInterrupt from None
+        
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    def _wait_for_next_check(self, interval_seconds: float, interactive: bool) -> None:
+        """
+        Sleep until the next check is due, reacting to keypresses meanwhile.
+        
+        Pressing c, space or Enter checks immediately; q quits.
+        
+        Args:
+            interval_seconds: Time to wait in seconds
+            interactive: Whether stdin is a terminal in cbreak mode
+            
+        Raises:
+            KeyboardInterrupt: If the user pressed q
+        """
+        if not interactive:
+            time.sleep(max(0.0, interval_seconds))
+            return
+        
+        deadline = time.monotonic() + interval_seconds
+        while True:
+            key = read_key(sys.stdin, deadline - time.monotonic())
+            if key is None:
+                return
+            if key.lower() == "q":
+                raise KeyboardInterrupt
+            if key in ("c", "C", " ", "\n"):
+                return
+    
     def run_continuous_monitoring(self, interval_seconds: int = 60, 
                                   notification_enabled: bool = True,
                                   archive_mode: bool = False,
@@ -1537,54 +3084,51 @@ class HabitMonitor:
         # Set default alert methods if not provided
         if alert_methods is None:
             alert_methods = ['desktop', 'system', 'browser', 'sound']
+        worker: Optional[AnalysisWorker] = None
         try:
             # First capture reference image
             self.capture_reference()
             
             # Show startup notification (try system specifically first, as it's most reliable)
             if notification_enabled:
-                try:
-                    # Try direct system notification first (most reliable)
-                    self.alert_manager.system_alert(
-                        "BadBits Monitoring Started",
-                        "Posture and habit monitoring is now active!"
-                    )
-                except Exception:
+                title = "BadBits Monitoring Started"
+                message = "Posture and habit monitoring is now active!"
+                
+                def fall_back_if_failed(future: "Future[bool]") -> None:
                     # Fallback to regular alert flow
-                    self.alert_manager.send_alert(
-                        "BadBits Monitoring Started", 
-                        "Posture and habit monitoring is now active!",
-                        methods=alert_methods
-                    )
+                    if not future.result():
+                        self.alert_manager.send_alert(title, message, methods=alert_methods)
+                
+                # Try direct system notification first (most reliable); it
+                # reports failure through its result instead of raising
+                startup_alert = self.alert_manager.system_alert(title, message)
+                startup_alert.add_done_callback(fall_back_if_failed)
             
             logger.info("Starting continuous posture monitoring...")
-            logger.info("Press Ctrl+C to stop")
+            logger.info("Press q or Ctrl+C to stop, c to check now")
             
             # Initialize session tracking
-            stats = CheckStats()
+            stats = CheckStats(habit_types=list(self.habits))
             last_alerts: List[AlertResult] = []
             error_message = ""
             
             # Initial banner - show differently based on mode
             if dashboard_mode:
                 # For dashboard mode, display an initial dashboard immediately
-                # Clear screen
-                if platform.system() != "Windows":
-                    os.system('clear')
-                else:
-                    os.system('cls')
+                # Clear screen and keep the cursor from flickering over redraws
+                clear_screen()
+                show_cursor(False)
+                self._screen_lines = None
                 
                 # Create initial empty alerts for display
                 initial_alerts = []
-                for habit_id, habit in self.habits.items():
-                    if habit.enabled:
-                        # Add a placeholder result for each enabled habit
-                        initial_alerts.append(AlertResult(
-                            alert_type=habit_id,
-                            is_active=False,  # Start with "good" status
-                            details="",
-                            timestamp=datetime.now()
-                        ))
+                for habit in self.enabled_habits:
+                    # Add a placeholder result for each enabled habit
+                    initial_alerts.append(AlertResult(
+                        alert_type=habit.habit_id,
+                        is_active=False,  # Start with "good" status
+                        details=""
+                    ))
                 
                 # Render and display initial dashboard
                 initial_dashboard = self.render_dashboard(
@@ -1593,7 +3137,7 @@ class HabitMonitor:
                     next_check_time=datetime.now() + timedelta(seconds=interval_seconds),
                     error_message=""
                 )
-                print(initial_dashboard)
+                self._screen_lines = redraw_screen(initial_dashboard)
             else:
                 # Text-based banner for non-dashboard mode
                 print("\n" + "="*50)
@@ -1604,145 +3148,107 @@ class HabitMonitor:
                     print("💾 Saving all checks to disk for review")
                 else:
                     print("🔒 Privacy mode: No images saved to disk")
-                print("❌ Press Ctrl+C to stop monitoring\n")
-            
-            while True:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                next_check_time = datetime.now() + timedelta(seconds=interval_seconds)
-                
-                # Try to capture and analyze current frame
-                try:
-                    current_image = self.capture_frame()
-                    collage = self.create_collage(current_image)
-                    current_alerts = self.analyze_habits(collage)
-                    
-                    # Save analysis if archiving is enabled
-                    analysis_dir = self.save_analysis(
-                        collage, 
-                        current_alerts, 
-                        timestamp, 
-                        archive_mode=archive_mode
-                    )
+                print("❌ Press q or Ctrl+C to stop monitoring (c checks now)\n")
+            
+            # Capture and inference run on their own thread
+            worker = AnalysisWorker(self)
+            worker.start()
+            
+            # Read single keys between checks without blocking on input
+            with raw_tty(sys.stdin) as interactive:
+                while True:
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    next_check_time = datetime.now() + timedelta(seconds=interval_seconds)
+                    check_deadline = time.monotonic() + interval_seconds
                     
-                    # Update stats and save the current alerts
-                    stats = stats.update(current_alerts)
-                    last_alerts = current_alerts
-                    error_message = ""
-                    
-                    # Send notifications
-                    for alert in current_alerts:
-                        if notification_enabled and alert.is_active:
-                            # Get the habit details if available
-                            habit = self.habits.get(alert.alert_type)
-                            
-                            # Create the notification title
-                            if habit:
-                                alert_name = habit.get_display_name()
-                                title = f"BadBits Alert: {alert_name}"
-                            else:
-                                title = f"BadBits Alert: {alert.alert_type.replace('_', ' ').title()}"
-                            
-                            # Create the notification message
-                            if habit and habit.active_message:
-                                # Use the custom message from the habit definition
-                                message = habit.active_message
-                                # Append details if available
-                                if alert.details:
-                                    message = f"{message} {alert.details}"
-                            else:
-                                # Default message if habit is not found
-                                message = f"Issue detected: {alert.details}" if alert.details else "Issue detected!"
-                            
-                            # Send alert using the specified methods
-                            self.alert_manager.send_alert(
-                                title=title,
-                                message=message,
-                                methods=alert_methods
-                            )
+                    # Try to capture and analyze current frame
+                    try:
+                        collage, current_alerts = self._run_check(worker, interactive)
+                        
+                        # Save analysis if archiving is enabled
+                        analysis_dir = self.save_analysis(
+                            collage, 
+                            current_alerts, 
+                            timestamp, 
+                            archive_mode=archive_mode
+                        )
+                        
+                        # Update stats and save the current alerts
+                        stats.record(current_alerts)
+                        last_alerts = current_alerts
+                        error_message = ""
+                        
+                        # Send notifications
+                        if notification_enabled:
+                            self._notify_active_alerts(current_alerts, alert_methods)
+                        
+                    except RuntimeError as e:
+                        error_message = str(e)
+                        logger.warning("Check failed: %s", error_message)
                     
-                except RuntimeError as e:
-                    error_message = str(e)
-                    logger.warning(f"Check failed: {error_message}")
-                
-                # Display results
-                if dashboard_mode:
-                    # Clear screen
-                    if platform.system() != "Windows":
-                        os.system('clear')
+                    # Display results
+                    if dashboard_mode:
+                        # Render and draw over the previous dashboard in place
+                        dashboard = self.render_dashboard(
+                            stats=stats,
+                            current_alerts=last_alerts,
+                            next_check_time=next_check_time,
+                            error_message=error_message
+                        )
+                        self._screen_lines = redraw_screen(dashboard, self._screen_lines)
                     else:
-                        os.system('cls')
-                    
-                    # Render and display dashboard
-                    dashboard = self.render_dashboard(
-                        stats=stats,
-                        current_alerts=last_alerts,
-                        next_check_time=next_check_time,
-                        error_message=error_message
-                    )
-                    print(dashboard)
-                else:
-                    # Traditional output mode
-                    print(f"\n🔍 CHECK #{stats.total_checks} at {timestamp}")
-                    print("="*50)
-                    
-                    # Print storage message
-                    if archive_mode and analysis_dir:
-                        print(f"📁 Analysis saved to: {analysis_dir}")
-                    elif not archive_mode:
-                        print("🔒 Privacy mode: No data saved to disk")
-                    
-                    # Display alerts
-                    print("\n📊 CURRENT STATUS:")
-                    print("-"*40)
-                    
-                    for alert in last_alerts:
-                        status = "⚠️ DETECTED" if alert.is_active else "✅ OK"
-                        alert_type_display = alert.alert_type.replace("_", " ").title()
-                        print(f"{alert.get_emoji()} {alert_type_display}: {status}")
+                        # Traditional output mode, collected and written at once
+                        lines = [f"\n🔍 CHECK #{stats.total_checks} at {timestamp}", "="*50]
                         
-                        if alert.is_active and alert.details:
-                            print(f"   Details: {alert.details}")
-                    
-                    # Show session stats
-                    print("\n📈 SESSION SUMMARY:")
-                    print("-"*40)
-                    print(f"• Duration: {stats.duration_minutes} minutes ({stats.total_checks} checks)")
-                    print(f"• Poor posture detected: {stats.posture_alerts}/{stats.total_checks} checks ({stats.posture_alert_percent}%)")
-                    print(f"• Nail biting detected: {stats.nail_biting_alerts}/{stats.total_checks} checks ({stats.nail_biting_alert_percent}%)")
+                        # Print storage message
+                        if archive_mode and analysis_dir:
+                            lines.append(f"📁 Analysis saved to: {analysis_dir}")
+                        elif not archive_mode:
+                            lines.append("🔒 Privacy mode: No data saved to disk")
+                        
+                        # Display alerts
+                        lines.append("\n📊 CURRENT STATUS:")
+                        lines.append("-"*40)
+                        
+                        for alert in last_alerts:
+                            status = "⚠️ DETECTED" if alert.is_active else "✅ OK"
+                            alert_type_display = format_alert_type(alert.alert_type)
+                            lines.append(f"{alert.get_emoji()} {alert_type_display}: {status}")
+                            
+                            if alert.is_active and alert.details:
+                                lines.append(f"   Details: {alert.details}")
+                        
+                        # Show session stats
+                        lines.append("\n📈 SESSION SUMMARY:")
+                        lines.append("-"*40)
+                        lines.append(f"• Duration: {stats.duration_minutes} minutes "
+                                     f"({stats.total_checks} checks)")
+                        for habit in self.enabled_habits:
+                            alert_count = stats.get_alert_count(habit.habit_id)
+                            percent = stats.get_alert_percent(habit.habit_id)
+                            lines.append(f"• {habit.get_display_name()} detected: "
+                                         f"{alert_count}/{stats.total_checks} checks ({percent}%)")
+                        
+                        # Show error if any
+                        if error_message:
+                            lines.append(f"\n⚠️ WARNING: {error_message}")
+                        
+                        lines.append(f"\n⏱️  Next check in {interval_seconds} seconds...")
+                        print("\n".join(lines), flush=True)
                     
-                    # Show error if any
-                    if error_message:
-                        print(f"\n⚠️ WARNING: {error_message}")
+                    # Wait for the next check, or act on a keypress right away
+                    self._wait_for_next_check(check_deadline - time.monotonic(), interactive)
                     
-                    print(f"\n⏱️  Next check in {interval_seconds} seconds...")
-                
-                # Wait for the next check
-                time.sleep(interval_seconds)
-                
         except KeyboardInterrupt:
             # Final summary on exit - using dashboard style
             if dashboard_mode:
                 # Clear screen once more for final message
-                if platform.system() != "Windows":
-                    os.system('clear')
-                else:
-                    os.system('cls')
-                
-                # Limited color palette for a clean, cohesive look - same as dashboard
-                class Colors:
-                    RESET = "\033[0m"
-                    BOLD = "\033[1m"
-                    DIM = "\033[2m"  # Dimmed text
-                    BLUE = "\033[34m"  # Standard blue (not bright)
-                    GREEN = "\033[32m"  # Standard green
-                    RED = "\033[31m"  # Standard red
-                    WHITE = "\033[37m"  # White
+                clear_screen()
                 
                 # Get terminal size
-                terminal_width = shutil.get_terminal_size().columns
+                terminal_width, border, dotted = self._terminal_layout()
                 
                 # Create a styled end message, consistent with dashboard
-                border = "─" * terminal_width
                 title = f"{Colors.BOLD}BadBits Monitor - Session Complete{Colors.RESET}"
                 
                 # The counterpart to LIVE indicator - show COMPLETE
@@ -1763,26 +3269,22 @@ class HabitMonitor:
                     status_line.center(terminal_width),
                     "",
                     summary_header,
-                    "┄" * terminal_width
+                    dotted
                 ]
                 
                 # Add stats for each habit in dashboard style
-                for habit_id, habit in self.habits.items():
-                    if habit.enabled:
-                        alert_count = stats.habit_alerts.get(habit_id, 0)
-                        percent = stats.get_alert_percent(habit_id)
-                        
-                        # Determine color based on percentage
-                        if percent > 50:
-                            percent_color = Colors.RED
-                        elif percent > 25:
-                            percent_color = Colors.RED + Colors.DIM
-                        else:
-                            percent_color = Colors.GREEN
-                        
-                        # Create summary line in dashboard style
-                        habit_line = f"{habit.emoji}  {habit.get_display_name()}: {alert_count}/{stats.total_checks} checks ({percent_color}{percent}%{Colors.RESET})"
-                        lines.append(habit_line)
+                for habit in self.enabled_habits:
+                    alert_count = stats.get_alert_count(habit.habit_id)
+                    percent = stats.get_alert_percent(habit.habit_id)
+                    
+                    # Determine color based on percentage
+                    percent_color = Colors.for_percent(percent)
+                    
+                    # Create summary line in dashboard style
+                    habit_line = (f"{habit.emoji}  {habit.get_display_name()}: "
+                                  f"{alert_count}/{stats.total_checks} checks "
+                                  f"({percent_color}{percent}%{Colors.RESET})")
+                    lines.append(habit_line)
                 
                 # Add data storage info if applicable
                 if archive_mode:
@@ -1800,84 +3302,183 @@ class HabitMonitor:
             
             else:
                 # Simple text version for non-dashboard mode
-                print("\n" + "="*50)
-                print("👋 MONITORING SESSION ENDED")
-                print("="*50)
-                print(f"• Session duration: {stats.duration_minutes} minutes ({stats.total_checks} checks)")
+                lines = [
+                    "\n" + "="*50,
+                    "👋 MONITORING SESSION ENDED",
+                    "="*50,
+                    f"• Session duration: {stats.duration_minutes} minutes "
+                    f"({stats.total_checks} checks)"
+                ]
                 
                 # Show stats for each habit
-                for habit_id, habit in self.habits.items():
-                    if habit.enabled:
-                        alert_count = stats.habit_alerts.get(habit_id, 0)
-                        percent = stats.get_alert_percent(habit_id)
-                        print(f"• {habit.emoji} {habit.get_display_name()}: {alert_count}/{stats.total_checks} checks ({percent}%)")
+                for habit in self.enabled_habits:
+                    alert_count = stats.get_alert_count(habit.habit_id)
+                    percent = stats.get_alert_percent(habit.habit_id)
+                    lines.append(f"• {habit.emoji} {habit.get_display_name()}: "
+                                 f"{alert_count}/{stats.total_checks} checks ({percent}%)")
                 
                 if archive_mode:
-                    print("\nAnalysis data saved to: " + str(self.output_dir))
-                print("="*50)
+                    lines.append("\nAnalysis data saved to: " + str(self.output_dir))
+                lines.append("="*50)
+                print("\n".join(lines))
             
         except Exception as e:
             logger.error(f"Monitoring failed: {e}")
             raise
         finally:
+            if dashboard_mode:
+                show_cursor(True)
+            if worker is not None:
+                worker.stop()
+            self._stop_grabber()
             if hasattr(self, 'cap'):
                 self.cap.release()
 
-def download_model(url: str, output_path: Path, chunk_size: int = 8192) -> None:
+def _download_in_parts(session: Any, url: str, path: Path, total_size: int, parts: int,
+                       chunk_size: int, progress: Any) -> None:
+    """
+    Download a file over several parallel HTTP range requests.
+    
+    Each part is written straight into its slice of a preallocated file.
+    
+    Args:
+        session: requests Session to fetch the parts with
+        url: URL of a server that accepts byte ranges
+        path: Where to write the file
+        total_size: File size in bytes
+        parts: Number of ranges to fetch at once
+        chunk_size: Size of chunks to read at a time
+        progress: tqdm progress bar to update
+        
+    Raises:
+        IOError: If the server ignores a range or a part ends early
+    """
+    with open(path, 'wb') as f:
+        f.truncate(total_size)
+    
+    part_size = -(-total_size // parts)  # Ceiling division
+    progress_lock = Lock()
+    
+    def fetch(start: int) -> None:
+        end = min(start + part_size, total_size) - 1
+        response = session.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True)
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise IOError("Server ignored the range request")
+        
+        # Each part gets its own handle, so seeks don't interfere
+        with open(path, 'r+b') as f:
+            f.seek(start)
+            for data in response.iter_content(chunk_size):
+                f.write(data)
+                with progress_lock:
+                    progress.update(len(data))
+            if f.tell() != end + 1:
+                raise IOError("Model download part ended early")
+    
+    with ThreadPoolExecutor(max_workers=parts, thread_name_prefix="bb-download") as pool:
+        futures = [pool.submit(fetch, start) for start in range(0, total_size, part_size)]
+        for future in futures:
+            future.result()
+
+def download_model(url: str, output_path: Path, chunk_size: int = 1 << 20,
+                   parallel_parts: int = 4) -> None:
     """
     Download and decompress the model file if it doesn't exist.
     
+    When the server supports byte ranges, the compressed file is fetched
+    over several connections at once and decompressed afterwards;
+    otherwise it is decompressed while it streams in.
+    
     Args:
         url: URL to download the model from
         output_path: Path where the model should be saved
-        chunk_size: Size of chunks to download at a time
+        chunk_size: Size of chunks to download at a time; large chunks keep
+            per-chunk overhead (progress updates, decompressor calls) negligible
+        parallel_parts: Number of connections for a ranged download; 1 disables it
     """
+    # Check if uncompressed model already exists
+    if output_path.exists():
+        logger.info(f"Model already exists at {output_path}")
+        return
+
+    # Only needed for a download; importing requests and tqdm is slow
+    import gzip
+    import zlib
+
     import requests
     from tqdm import tqdm
-    import gzip
-    import shutil
 
     # Create models directory if it doesn't exist
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Check if uncompressed model already exists
-    if output_path.exists():
-        logger.info(f"Model already exists at {output_path}")
-        return
-
     compressed_path = output_path.parent / (output_path.name + '.gz')
     
-    # Download if compressed file doesn't exist
-    if not compressed_path.exists():
-        logger.info(f"Downloading model from {url}")
-        response = requests.get(url, stream=True)
-        total_size = int(response.headers.get('content-length', 0))
-
-        # Create progress bar
-        progress = tqdm(
-            total=total_size,
-            unit='iB',
-            unit_scale=True,
-            desc="Downloading model"
-        )
-
-        # Download with progress bar
-        with open(compressed_path, 'wb') as f:
-            for data in response.iter_content(chunk_size):
-                progress.update(len(data))
-                f.write(data)
-        progress.close()
+    # Write to temporary names so an interrupted run isn't taken for a
+    # finished download
+    partial_path = output_path.parent / (output_path.name + '.part')
+    partial_compressed_path = output_path.parent / (compressed_path.name + '.part')
+    
+    # One session keeps connections alive between requests. The file is
+    # already gzipped, so ask for it as-is rather than re-encoded in transit.
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = "identity"
+    
+    try:
+        if not compressed_path.exists():
+            logger.info(f"Downloading model from {url}")
+            
+            # Resolve redirects once, and see whether the file can be fetched in ranges
+            head = session.head(url, allow_redirects=True)
+            head.raise_for_status()
+            total_size = int(head.headers.get('content-length', 0))
+            ranged = (parallel_parts > 1
+                      and head.headers.get('accept-ranges') == 'bytes'
+                      and total_size >= parallel_parts * chunk_size)
 
-    # Decompress the file
-    if compressed_path.exists():
-        logger.info("Decompressing model file...")
-        with gzip.open(compressed_path, 'rb') as f_in:
-            with open(output_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
-        
-        # Optionally remove the compressed file
-        compressed_path.unlink()
-        logger.info(f"Model ready at {output_path}")
+            # Create progress bar
+            progress = tqdm(
+                total=total_size,
+                unit='iB',
+                unit_scale=True,
+                desc="Downloading model"
+            )
+            
+            try:
+                if ranged:
+                    _download_in_parts(session, head.url, partial_compressed_path, total_size,
+                                       parallel_parts, chunk_size, progress)
+                    partial_compressed_path.replace(compressed_path)
+                else:
+                    # Decompress while downloading, so the compressed file never touches disk
+                    response = session.get(head.url, stream=True)
+                    response.raise_for_status()
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)  # gzip header
+                    with open(partial_path, 'wb') as f:
+                        for data in response.iter_content(chunk_size):
+                            progress.update(len(data))
+                            f.write(decompressor.decompress(data))
+                        f.write(decompressor.flush())
+                    if not decompressor.eof:
+                        raise IOError("Model download ended before the end of the compressed data")
+                    partial_path.replace(output_path)
+            finally:
+                progress.close()
+        
+        # Decompress a ranged download, or one left over from an older version
+        if compressed_path.exists():
+            logger.info("Decompressing model file...")
+            with gzip.open(compressed_path, 'rb') as f_in:
+                with open(partial_path, 'wb') as f_out:
+                    shutil.copyfileobj(f_in, f_out, chunk_size)
+            partial_path.replace(output_path)
+            compressed_path.unlink()
+    finally:
+        session.close()
+        for path in (partial_path, partial_compressed_path):
+            if path.exists():
+                path.unlink()
+    logger.info(f"Model ready at {output_path}")
 
 def parse_arguments() -> argparse.Namespace:
     """
@@ -1949,11 +3550,18 @@ def parse_arguments() -> argparse.Namespace:
         help="Only download the model without starting monitoring"
     )
     
+    parser.add_argument(
+        "--model-variant",
+        choices=sorted(MODEL_VARIANTS),
+        default=DEFAULT_MODEL_VARIANT,
+        help="Moondream model size and weight precision to download and use"
+    )
+    
     parser.add_argument(
         "--model-path", "-m",
         type=str,
-        default="models/moondream-2b-int8.mf",
-        help="Path to the Moondream model file"
+        default=None,
+        help="Path to the Moondream model file (defaults to the --model-variant file in models/)"
     )
     
     # Storage options
@@ -2021,6 +3629,9 @@ def parse_arguments() -> argparse.Namespace:
 
 def main() -> None:
     """Main function to run the posture monitoring application."""
+    # Print a traceback if a native library (OpenCV, ONNX Runtime) crashes
+    faulthandler.enable()
+    
     # Parse command line arguments
     args = parse_arguments()
     
@@ -2029,8 +3640,9 @@ def main() -> None:
         logging.getLogger().setLevel(logging.WARNING)
     
     # Model information
-    MODEL_URL = "https://huggingface.co/vikhyatk/moondream2/resolve/9dddae84d54db4ac56fe37817aeaeb502ed083e2/moondream-2b-int8.mf.gz?download=true"
-    MODEL_PATH = Path(args.model_path)
+    model_file = MODEL_VARIANTS[args.model_variant]
+    MODEL_URL = f"{MODEL_BASE_URL}/{model_file}.gz?download=true"
+    MODEL_PATH = Path(args.model_path) if args.model_path else Path("models") / model_file
     
     try:
         # Print banner